@@ -10,6 +10,13 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+# All job columns except the (potentially large) results blob
+_JOB_SUMMARY_COLUMNS = """
+    id, user_id, status, created_at, started_at, completed_at,
+    strategy_id, strategy_name, universe_key, universe_name, parameters,
+    error_message, progress, stocks_processed, stocks_total, result_summary
+"""
+
 
 class ScreeningJobQueue:
     """Manage screening jobs in SQLite queue"""
@@ -139,14 +146,17 @@ class ScreeningJobQueue:
     def get_user_jobs(
         self, user_id: str, status: Optional[str] = None, limit: int = 50
     ) -> List[Dict]:
-        """Get all jobs for a user"""
+        """Get jobs for a user, newest first
+
+        Results are not included; load them with get_job_results().
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         if status:
             cursor.execute(
-                """
-                SELECT * FROM screening_jobs 
+                f"""
+                SELECT {_JOB_SUMMARY_COLUMNS} FROM screening_jobs
                 WHERE user_id = ? AND status = ?
                 ORDER BY created_at DESC
                 LIMIT ?
@@ -155,8 +165,8 @@ class ScreeningJobQueue:
             )
         else:
             cursor.execute(
-                """
-                SELECT * FROM screening_jobs 
+                f"""
+                SELECT {_JOB_SUMMARY_COLUMNS} FROM screening_jobs
                 WHERE user_id = ?
                 ORDER BY created_at DESC
                 LIMIT ?
@@ -172,8 +182,6 @@ class ScreeningJobQueue:
             job["parameters"] = (
                 json.loads(job["parameters"]) if job["parameters"] else {}
             )
-            if job.get("results"):
-                job["results"] = json.loads(job["results"])
             if job.get("result_summary"):
                 job["result_summary"] = json.loads(job["result_summary"])
             jobs.append(job)
@@ -181,6 +189,20 @@ class ScreeningJobQueue:
         conn.close()
         return jobs
 
+    def get_job_results(self, job_id: str) -> Optional[List[Dict]]:
+        """Get the stored results of a job (None if there are none)"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT results FROM screening_jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+
+        conn.close()
+
+        if row and row[0]:
+            return json.loads(row[0])
+        return None
+
     def get_next_pending_job(self) -> Optional[Dict]:
         """Get next pending job (FIFO)"""
         conn = sqlite3.connect(self.db_path)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 import sys
 from pathlib import Path
 
@@ -9,6 +9,27 @@ sys.path.insert(0, str(root_dir))
 from backend.api import fmp_api
 
 
+def _mos_core(
+    eps_now: float,
+    growth_rate: float,
+    discount_rate: float,
+    margin_of_safety: float,
+    years_ahead: int = 10,
+) -> Tuple[float, float, float, float]:
+    """
+    Reine MOS-Arithmetik ohne I/O.
+
+    Returns:
+        (eps_future, future_value, fair_value_today, mos_price)
+    """
+    eps_future = eps_now * ((1 + growth_rate) ** years_ahead)
+    future_pe = growth_rate * 200
+    future_value = eps_future * future_pe
+    fair_value_today = future_value / ((1 + discount_rate) ** years_ahead)
+    mos_price = fair_value_today * (1 - margin_of_safety)
+    return eps_future, future_value, fair_value_today, mos_price
+
+
 def calculate_mos_value_from_ticker(
     ticker: str,
     year: int,
@@ -45,11 +66,9 @@ def calculate_mos_value_from_ticker(
     eps_now = data[0]["EPS"]
 
     # Calculate intrinsic values
-    eps_10y = eps_now * ((1 + growth_rate) ** 10)
-    future_pe = growth_rate * 200
-    future_value = eps_10y * future_pe
-    fair_value_today = future_value / ((1 + discount_rate) ** 10)
-    mos_price = fair_value_today * (1 - margin_of_safety)
+    eps_10y, future_value, fair_value_today, mos_price = _mos_core(
+        eps_now, growth_rate, discount_rate, margin_of_safety
+    )
 
     # Get current stock price
     current_price = 0
@@ -93,29 +112,53 @@ def calculate_mos_value_from_ticker(
         "Investment Recommendation": _get_investment_recommendation(
             current_price, fair_value_today, mos_price
         ),
+        "recommendation_code": _get_recommendation_code(
+            current_price, fair_value_today, mos_price
+        ),
     }
 
     print("Intrinsic Value Result: %s", result)
     return result
 
 
-def _get_investment_recommendation(
+_RECOMMENDATION_TEXT = {
+    "strong_buy": "Strong Buy (Below MOS price)",
+    "buy": "Buy (Below fair value)",
+    "hold": "Hold (Near fair value)",
+    "sell": "Avoid (Overvalued)",
+    "no_data": "No price data available",
+}
+
+
+def _get_recommendation_code(
     current_price: float, fair_value: float, mos_price: float
 ) -> str:
     """
-    Gibt eine Investitionsempfehlung basierend auf den Preisvergleichen.
+    Gibt einen kanonischen Code für die Investitionsempfehlung zurück
+    ("strong_buy", "buy", "hold", "sell" oder "no_data").
     """
     if current_price <= 0:
-        return "No price data available"
+        return "no_data"
 
     if current_price <= mos_price:
-        return "Strong Buy (Below MOS price)"
+        return "strong_buy"
     elif current_price <= fair_value:
-        return "Buy (Below fair value)"
+        return "buy"
     elif current_price <= fair_value * 1.1:
-        return "Hold (Near fair value)"
+        return "hold"
     else:
-        return "Avoid (Overvalued)"
+        return "sell"
+
+
+def _get_investment_recommendation(
+    current_price: float, fair_value: float, mos_price: float
+) -> str:
+    """
+    Gibt eine Investitionsempfehlung basierend auf den Preisvergleichen.
+    """
+    return _RECOMMENDATION_TEXT[
+        _get_recommendation_code(current_price, fair_value, mos_price)
+    ]
 
 
 def calculate_mos_from_data(
@@ -180,11 +223,9 @@ def calculate_mos_from_data(
         }
 
     # Calculate intrinsic values (SAME LOGIC AS ORIGINAL!)
-    eps_10y = eps_now * ((1 + growth_rate) ** 10)
-    future_pe = growth_rate * 200
-    future_value = eps_10y * future_pe
-    fair_value_today = future_value / ((1 + discount_rate) ** 10)
-    mos_price = fair_value_today * (1 - margin_of_safety)
+    eps_10y, future_value, fair_value_today, mos_price = _mos_core(
+        eps_now, growth_rate, discount_rate, margin_of_safety
+    )
 
     # Calculate comparison with fair value
     price_comparison = "N/A"
@@ -43,19 +43,32 @@ def _calculate_pbt_price(
     return buy_price, fair_value, None
 
 
-def _get_pbt_result(ticker: str, year: int, growth_rate: float) -> Optional[dict]:
+def _find_fcf_per_share(key_metrics: List[Dict], year: int) -> Optional[float]:
+    """
+    Sucht den FCF pro Aktie für ein Jahr in den Key Metrics.
+    """
+    for entry in key_metrics:
+        if str(entry.get("calendarYear")) == str(year):
+            return entry.get("freeCashFlowPerShare")
+    return None
+
+
+def _get_pbt_result(
+    ticker: str,
+    year: int,
+    growth_rate: float,
+    key_metrics: Optional[List[Dict]] = None,
+) -> Optional[dict]:
     """
     Holt PBT-Daten für ein bestimmtes Jahr - ähnlich wie _get_ten_cap_result
+
+    Bereits geladene key_metrics können übergeben werden, um den Abruf zu sparen.
     """
     try:
         # FCF pro Aktie holen
-        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
-        fcf = None
-
-        for entry in key_metrics:
-            if str(entry.get("calendarYear")) == str(year):
-                fcf = entry.get("freeCashFlowPerShare")
-                break
+        if key_metrics is None:
+            key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
+        fcf = _find_fcf_per_share(key_metrics, year)
 
         if fcf is None:
             print(f"Kein FCF pro Aktie für Jahr {year} gefunden.")
@@ -67,6 +80,7 @@ def _get_pbt_result(ticker: str, year: int, growth_rate: float) -> Optional[dict
         # Aktuellen Aktienkurs holen
         current_price = None
         price_comparison = "N/A"
+        valuation_code = "no_data"
         percentage_diff_fair = 0
         percentage_diff_buy = 0
 
@@ -81,21 +95,24 @@ def _get_pbt_result(ticker: str, year: int, growth_rate: float) -> Optional[dict
                 percentage_diff_buy = ((current_price - buy_price) / buy_price) * 100
 
                 if current_price <= buy_price:
+                    valuation_code = "below_buy"
                     price_comparison = (
                         f"Below buy price by {abs(percentage_diff_buy):.1f}%"
                     )
                 elif current_price <= fair_value:
+                    valuation_code = "below_fair"
                     price_comparison = (
                         f"Below fair value by {abs(percentage_diff_fair):.1f}%"
                     )
                 else:
+                    valuation_code = "overvalued"
                     price_comparison = f"Overvalued by {abs(percentage_diff_fair):.1f}%"
 
         except Exception as e:
             print(f"Could not fetch current price for {ticker}: {e}")
 
         # Investment Recommendation
-        investment_recommendation = _get_investment_recommendation(
+        recommendation_code = _get_recommendation_code(
             current_price, fair_value, buy_price
         )
 
@@ -108,9 +125,11 @@ def _get_pbt_result(ticker: str, year: int, growth_rate: float) -> Optional[dict
             "fair_value": fair_value,
             "current_stock_price": current_price,
             "price_comparison": price_comparison,
+            "valuation_code": valuation_code,
             "percentage_diff_fair": percentage_diff_fair,
             "percentage_diff_buy": percentage_diff_buy,
-            "investment_recommendation": investment_recommendation,
+            "investment_recommendation": _RECOMMENDATION_TEXT[recommendation_code],
+            "recommendation_code": recommendation_code,
         }
 
     except Exception as e:
@@ -118,23 +137,44 @@ def _get_pbt_result(ticker: str, year: int, growth_rate: float) -> Optional[dict
         return None
 
 
-def _get_investment_recommendation(
+_RECOMMENDATION_TEXT = {
+    "strong_buy": "Strong Buy (At or below payback price)",
+    "buy": "Buy (Below fair value)",
+    "hold": "Hold (Near fair value)",
+    "sell": "Avoid (Overvalued)",
+    "no_data": "No price data available",
+}
+
+
+def _get_recommendation_code(
     current_price: float, fair_value: float, buy_price: float
 ) -> str:
     """
-    Gibt eine Investitionsempfehlung basierend auf den Preisvergleichen.
+    Gibt einen kanonischen Code für die Investitionsempfehlung zurück
+    ("strong_buy", "buy", "hold", "sell" oder "no_data").
     """
     if current_price is None or current_price <= 0:
-        return "No price data available"
+        return "no_data"
 
     if current_price <= buy_price:
-        return "Strong Buy (At or below payback price)"
+        return "strong_buy"
     elif current_price <= fair_value:
-        return "Buy (Below fair value)"
+        return "buy"
     elif current_price <= fair_value * 1.1:
-        return "Hold (Near fair value)"
+        return "hold"
     else:
-        return "Avoid (Overvalued)"
+        return "sell"
+
+
+def _get_investment_recommendation(
+    current_price: float, fair_value: float, buy_price: float
+) -> str:
+    """
+    Gibt eine Investitionsempfehlung basierend auf den Preisvergleichen.
+    """
+    return _RECOMMENDATION_TEXT[
+        _get_recommendation_code(current_price, fair_value, buy_price)
+    ]
 
 
 def calculate_pbt_from_ticker(
@@ -142,11 +182,15 @@ def calculate_pbt_from_ticker(
     year: int,
     growth_estimate: float,
     return_full_table: bool = False,
+    key_metrics: Optional[List[Dict]] = None,
 ) -> Tuple[float, float, Optional[List[Dict]], Dict]:
     """
     Legacy-Funktion für Kompatibilität - verwendet _get_pbt_result
     """
-    result = _get_pbt_result(ticker, year, growth_estimate)
+    if key_metrics is None:
+        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
+
+    result = _get_pbt_result(ticker, year, growth_estimate, key_metrics)
 
     if not result:
         raise ValueError(f"Could not calculate PBT for {ticker} in {year}")
@@ -154,12 +198,7 @@ def calculate_pbt_from_ticker(
     # Tabelle nur wenn explizit angefordert
     table = None
     if return_full_table:
-        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
-        fcf = None
-        for entry in key_metrics:
-            if str(entry.get("calendarYear")) == str(year):
-                fcf = entry.get("freeCashFlowPerShare")
-                break
+        fcf = _find_fcf_per_share(key_metrics, year)
 
         if fcf:
             _, _, table = _calculate_pbt_price(fcf, growth_estimate, True)
@@ -180,12 +219,35 @@ def calculate_pbt_from_ticker(
 
 
 def calculate_pbt_with_comparison(
-    ticker: str, year: int, growth_rate: float
+    ticker: str,
+    year: int,
+    growth_rate: float,
+    key_metrics: Optional[List[Dict]] = None,
 ) -> Optional[dict]:
     """
     Neue Funktion analog zu calculate_ten_cap_with_comparison
     """
-    return _get_pbt_result(ticker, year, growth_rate)
+    return _get_pbt_result(ticker, year, growth_rate, key_metrics)
+
+
+def calculate_pbt_multi_year(
+    ticker: str,
+    years: List[int],
+    growth_rate: float,
+    key_metrics: Optional[List[Dict]] = None,
+) -> Dict[int, Optional[dict]]:
+    """
+    Berechnet PBT-Ergebnisse für mehrere Jahre mit nur einem Key-Metrics-Abruf
+
+    Returns:
+        Dict Jahr -> Ergebnis von calculate_pbt_with_comparison (oder None)
+    """
+    if key_metrics is None:
+        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
+
+    return {
+        year: _get_pbt_result(ticker, year, growth_rate, key_metrics) for year in years
+    }
 
 
 default_language = {
@@ -251,28 +313,30 @@ def _format_pbt_report(data: dict, table: List[Dict], language: dict) -> str:
 
 
 def print_pbt_analysis(
-    ticker: str, year: int, growth_rate: float, language: dict = None
+    ticker: str,
+    year: int,
+    growth_rate: float,
+    language: dict = None,
+    key_metrics: Optional[List[Dict]] = None,
 ):
     """
     Druckt eine detaillierte PBT Analyse mit Cashflow-Tabelle
     """
-    if language is None:
-        language = default_language
+    # Fehlende Texte (z.B. bei verschachteltem UI-Sprachdict) aus den Defaults
+    language = {**default_language, **(language or {})}
+
+    if key_metrics is None:
+        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
 
     # Hole die Basis-Daten
-    result_data = _get_pbt_result(ticker, year, growth_rate)
+    result_data = _get_pbt_result(ticker, year, growth_rate, key_metrics)
     if not result_data:
         print(f"[ERROR] Could not find complete data for {ticker.upper()} in {year}")
         print(f"{year}: N/A")
         return
 
     # Generiere die detaillierte Tabelle
-    key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
-    fcf = None
-    for entry in key_metrics:
-        if str(entry.get("calendarYear")) == str(year):
-            fcf = entry.get("freeCashFlowPerShare")
-            break
+    fcf = _find_fcf_per_share(key_metrics, year)
 
     if not fcf:
         print(f"[ERROR] Could not find FCF for {ticker.upper()} in {year}")
@@ -284,6 +348,28 @@ def print_pbt_analysis(
     print(_format_pbt_report(result_data, table, language))
 
 
+def print_pbt_analysis_multi(
+    ticker: str,
+    years: List[int],
+    growth_rate: float,
+    language: dict = None,
+    key_metrics: Optional[List[Dict]] = None,
+):
+    """
+    Druckt PBT Analysen für mehrere Jahre mit nur einem Key-Metrics-Abruf.
+    Jeder Report beginnt mit einer Zeile "=== Year {year} ===".
+    """
+    if key_metrics is None:
+        key_metrics = fmp_api.get_key_metrics(ticker, limit=20)
+
+    for year in years:
+        print(f"=== Year {year} ===")
+        try:
+            print_pbt_analysis(ticker, year, growth_rate, language, key_metrics)
+        except Exception as e:
+            print(f"[ERROR] {ticker.upper()} {year}: {e}")
+
+
 if __name__ == "__main__":
     ticker = "aapl"
     year = 2024
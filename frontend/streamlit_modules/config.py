@@ -2,6 +2,7 @@ import streamlit as st
 import io
 import sys
 import os
+import json
 import backend.utils.config_load as config_load
 from backend.utils.user_preferences import (
     load_user_language,
@@ -60,6 +61,8 @@ def load_app_config():
             }
             st.session_state.current_language = "en"
             st.session_state.all_languages = {"en": st.session_state.language}
+            # Notfall-Texte weichen von en.json ab
+            st.session_state.pop("text_cache", None)
             st.session_state.persist = {}
             st.session_state.config = {}
 
@@ -88,6 +91,16 @@ def reload_user_config():
 
 def get_text(key, fallback=None):
     """Get localized text from language JSON with dot notation support"""
+    # Memo pro Session: die Sprachdaten liegen im Session State, nicht global
+    text_cache = st.session_state.setdefault("text_cache", {})
+    cache_key = (st.session_state.get("current_language"), key, fallback)
+    if cache_key not in text_cache:
+        text_cache[cache_key] = _lookup_text(key, fallback)
+    return text_cache[cache_key]
+
+
+def _lookup_text(key, fallback):
+    """Textauflösung aus den Sprachdaten der aktuellen Session"""
     language_data = st.session_state.get("language", {})
 
     # Split key by dot for nested access (e.g., "mos.title")
@@ -121,16 +134,6 @@ def get_text(key, fallback=None):
     return value if isinstance(value, str) else (fallback if fallback else key)
 
 
-def save_persistence_data():
-    """Save current persistence data benutzerspezifisch"""
-    try:
-        if st.session_state.get("authenticated", False):
-            persist_data = st.session_state.get("persist", {})
-            save_user_persistence(persist_data)
-    except Exception:
-        pass  # Fail silently
-
-
 def change_language(new_language):
     """Ändert die Sprache und speichert sie benutzerspezifisch"""
     try:
@@ -210,20 +213,6 @@ def initialize_global_ticker():
         st.session_state.global_ticker = persist_data.get("global_ticker", "MSFT")
 
 
-def initialize_global_ticker():
-    """
-    Initialisiert den globalen Ticker im session_state.
-    Lädt ihn aus der Persistence oder setzt Default "MSFT".
-    Sollte einmalig am Anfang der App aufgerufen werden.
-    """
-    import streamlit as st
-
-    if "global_ticker" not in st.session_state:
-        # Lade aus Persistence oder setze Default
-        persist_data = st.session_state.get("persist", {})
-        st.session_state.global_ticker = persist_data.get("global_ticker", "MSFT")
-
-
 def save_global_ticker():
     """
     Speichert den globalen Ticker in die Persistence.
@@ -240,15 +229,47 @@ def save_persistence_data():
     """Save current persistence data benutzerspezifisch in frontend/config/user_config/"""
     try:
         if st.session_state.get("authenticated", False):
-            from backend.utils.user_preferences import save_user_persistence
-
             persist_data = st.session_state.get("persist", {})
-            save_user_persistence(persist_data)
+
+            # Unveränderte Daten nicht erneut auf die Disk schreiben
+            persist_hash = hash(
+                json.dumps(
+                    [st.session_state.get("username"), persist_data],
+                    sort_keys=True,
+                    default=str,
+                )
+            )
+            if persist_hash == st.session_state.get("_persist_hash"):
+                st.session_state.pop("_persist_dirty", None)
+                return
+
+            if save_user_persistence(persist_data):
+                st.session_state["_persist_hash"] = persist_hash
+                st.session_state.pop("_persist_dirty", None)
     except Exception as e:
         print(f"Error saving persistence: {e}")
         pass  # Fail silently
 
 
+def mark_persist_dirty():
+    """Merkt Änderungen an der Persistence vor, ohne sofort auf die Disk zu schreiben"""
+    st.session_state["_persist_dirty"] = True
+
+
+def update_persist_section(section, values):
+    """Übernimmt Werte in persist[section] und merkt nur echte Änderungen vor"""
+    current = st.session_state.persist.setdefault(section, {})
+    if any(current.get(k) != v for k, v in values.items()):
+        current.update(values)
+        mark_persist_dirty()
+
+
+def flush_persistence_data():
+    """Schreibt vorgemerkte Änderungen (z.B. Global Ticker) gesammelt weg"""
+    if st.session_state.get("_persist_dirty"):
+        save_persistence_data()
+
+
 def get_effective_ticker(module_ticker, use_individual):
     """
     Hilfsfunktion um den effektiven Ticker zu bekommen.
@@ -1,5 +1,5 @@
 import streamlit as st
-from ..config import get_text, save_persistence_data
+from ..config import get_text, save_persistence_data, mark_persist_dirty
 import backend.valuekit_ai.core.valuekit_integration as valuekit_ai
 import backend.valuekit_ai.config.analysis_config as analysis_config
 from io import StringIO
@@ -66,7 +66,7 @@ def show_ai_analysis():
             if ticker != st.session_state.global_ticker:
                 st.session_state.global_ticker = ticker
                 st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
+                mark_persist_dirty()
 
     with col2:
         year = st.number_input(
@@ -1,5 +1,5 @@
 import streamlit as st
-from ..config import get_text, save_persistence_data, capture_output
+from ..config import get_text, save_persistence_data, mark_persist_dirty, capture_output
 import backend.logic.cagr
 import pandas as pd
 
@@ -55,7 +55,7 @@ def show_cagr_analysis():
                 st.session_state.global_ticker = ticker
                 # Speichere globalen Ticker in Persistence
                 st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
+                mark_persist_dirty()
 
     with col2:
         start_year = st.number_input(
@@ -1,5 +1,5 @@
 import streamlit as st
-from ..config import get_text, save_persistence_data
+from ..config import get_text, save_persistence_data, mark_persist_dirty
 import backend.logic.capital_allocation as capital_allocation_logic
 
 
@@ -40,7 +40,7 @@ def show_capital_allocation_analysis():
             if ticker != st.session_state.global_ticker:
                 st.session_state.global_ticker = ticker
                 st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
+                mark_persist_dirty()
 
     with col2:
         multi_year = st.checkbox(
@@ -1,14 +1,33 @@
 import streamlit as st
-from ..config import get_text, save_persistence_data
-import backend.logic.mos as mos_logic
+from ..config import (
+    get_text,
+    mark_persist_dirty,
+    update_persist_section,
+    flush_persistence_data,
+)
+import numpy as np
 import pandas as pd
 
+# Darstellung der Empfehlung je Code aus backend.logic.mos
+_REC_RENDER = {
+    "strong_buy": ("🚀", st.success),
+    "buy": ("✅", st.success),
+    "hold": ("⚖️", st.warning),
+    "sell": ("❌", st.error),
+}
+
 
 def show_mos_analysis():
     """Margin of Safety Analysis Interface with multi-year support"""
     st.header(f"🛡️ {get_text('mos.title')}")
     st.write(get_text("mos.description"))
 
+    _mos_analysis_fragment()
+
+
+@st.fragment
+def _mos_analysis_fragment():
+    """Eingabeformular und Ergebnisse; läuft isoliert vom Rest der Seite"""
     persist_data = st.session_state.persist.get("MOS", {})
 
     if "global_ticker" not in st.session_state:
@@ -16,15 +35,22 @@ def show_mos_analysis():
             "global_ticker", "MSFT"
         )
 
-    use_individual_ticker = st.checkbox(
-        get_text("common.use_individual_ticker"),
-        value=persist_data.get("use_individual_ticker", False),
-        key="mos_use_individual",
-    )
-
+    # Modus-Schalter ausserhalb des Formulars, da sie das Layout umschalten
     col1, col2 = st.columns(2)
-
     with col1:
+        use_individual_ticker = st.checkbox(
+            get_text("common.use_individual_ticker"),
+            value=persist_data.get("use_individual_ticker", False),
+            key="mos_use_individual",
+        )
+    with col2:
+        multi_year = st.checkbox(
+            get_text("common.multi_year_checkbox"),
+            value=persist_data.get("multi_year", False),
+            key="mos_multi",
+        )
+
+    with st.form("mos_form", clear_on_submit=False):
         if use_individual_ticker:
             ticker = st.text_input(
                 get_text("common.ticker_symbol"),
@@ -38,75 +64,75 @@ def show_mos_analysis():
                 key="mos_ticker_global",
                 help=get_text("common.global_ticker_help"),
             ).upper()
-            if ticker != st.session_state.global_ticker:
-                st.session_state.global_ticker = ticker
-                st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
 
-    with col2:
-        multi_year = st.checkbox(
-            get_text("common.multi_year_checkbox"),
-            value=persist_data.get("multi_year", False),
-            key="mos_multi",
-        )
+        if multi_year:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                start_year = st.number_input(
+                    get_text("common.start_year"),
+                    min_value=1990,
+                    max_value=2030,
+                    value=int(persist_data.get("start_year", 2020)),
+                    key="mos_start",
+                )
+            with col2:
+                end_year = st.number_input(
+                    get_text("common.end_year"),
+                    min_value=1990,
+                    max_value=2030,
+                    value=int(persist_data.get("end_year", 2024)),
+                    key="mos_end",
+                )
+            with col3:
+                growth_rate = st.number_input(
+                    get_text("mos.growth_rate"),
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=float(persist_data.get("growth_rate", 15.0)),
+                    step=0.1,
+                    key="mos_growth",
+                )
+            years = np.arange(start_year, end_year + 1, dtype=np.int32)
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                single_year = st.number_input(
+                    get_text("common.year"),
+                    min_value=1990,
+                    max_value=2030,
+                    value=int(persist_data.get("single_year", 2024)),
+                    key="mos_single",
+                )
+            with col2:
+                growth_rate = st.number_input(
+                    get_text("mos.growth_rate"),
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=float(persist_data.get("growth_rate", 15.0)),
+                    step=0.1,
+                    key="mos_growth",
+                )
+            years = np.array([single_year], dtype=np.int32)
 
-    if multi_year:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            start_year = st.number_input(
-                get_text("common.start_year"),
-                min_value=1990,
-                max_value=2030,
-                value=int(persist_data.get("start_year", 2020)),
-                key="mos_start",
-            )
-        with col2:
-            end_year = st.number_input(
-                get_text("common.end_year"),
-                min_value=1990,
-                max_value=2030,
-                value=int(persist_data.get("end_year", 2024)),
-                key="mos_end",
-            )
-        with col3:
-            growth_rate = st.number_input(
-                get_text("mos.growth_rate"),
-                min_value=0.0,
-                max_value=100.0,
-                value=float(persist_data.get("growth_rate", 15.0)),
-                step=0.1,
-                key="mos_growth",
-            )
-        years = list(range(start_year, end_year + 1))
-    else:
-        col1, col2 = st.columns(2)
-        with col1:
-            single_year = st.number_input(
-                get_text("common.year"),
-                min_value=1990,
-                max_value=2030,
-                value=int(persist_data.get("single_year", 2024)),
-                key="mos_single",
-            )
-        with col2:
-            growth_rate = st.number_input(
-                get_text("mos.growth_rate"),
-                min_value=0.0,
-                max_value=100.0,
-                value=float(persist_data.get("growth_rate", 15.0)),
-                step=0.1,
-                key="mos_growth",
-            )
-        years = [single_year]
-
-    st.info(f"💡 {get_text('mos.mos_fixed_info')}")
-
-    if st.button(get_text("mos.run_analysis"), key="mos_run"):
+        st.info(f"💡 {get_text('mos.mos_fixed_info')}")
+
+        submitted = st.form_submit_button(get_text("mos.run_analysis"), key="mos_run")
+
+    # Global Ticker nur vormerken; geschrieben wird beim Run-Klick oder Seitenwechsel
+    if not use_individual_ticker and ticker != st.session_state.global_ticker:
+        st.session_state.global_ticker = ticker
+        st.session_state.persist["global_ticker"] = ticker
+        mark_persist_dirty()
+
+    if submitted:
         if not ticker:
             st.error(get_text("common.please_enter_ticker"))
         elif multi_year and start_year >= end_year:
             st.error(get_text("common.start_year_before_end"))
         else:
+            # Backend erst beim ersten Klick laden (verkürzt den Kaltstart der Seite)
+            import backend.logic.mos as mos_logic
+
             with st.spinner(get_text("mos.calculating").format(ticker)):
                 try:
                     margin_of_safety = 0.50
@@ -124,52 +150,99 @@ def show_mos_analysis():
                     else:
                         persist_update["single_year"] = str(single_year)
 
-                    st.session_state.persist.setdefault("MOS", {}).update(
-                        persist_update
+                    # Nur schreiben, wenn sich Eingaben oder Global Ticker geändert haben
+                    update_persist_section("MOS", persist_update)
+                    flush_persistence_data()
+
+                    # Identische Eingaben wie beim letzten Lauf: Ergebnis wiederverwenden
+                    run_key = (
+                        ticker,
+                        tuple(years.tolist()),
+                        growth_rate,
+                        margin_of_safety,
                     )
-                    save_persistence_data()
-
-                    results = []
-                    for year in years:
-                        result = mos_logic.calculate_mos_value_from_ticker(
-                            ticker,
-                            year,
-                            growth_rate / 100,
-                            margin_of_safety=margin_of_safety,
-                        )
-                        if result:
-                            results.append(result)
+                    if run_key == st.session_state.get("mos_last_key"):
+                        results = st.session_state["mos_last_results"]
+                    else:
+                        g = growth_rate / 100.0
+                        results = []
+                        for year in years.tolist():
+                            result = mos_logic.calculate_mos_value_from_ticker(
+                                ticker,
+                                year,
+                                g,
+                                margin_of_safety=margin_of_safety,
+                            )
+                            if result:
+                                results.append(result)
+
+                        # Nach Jahr sortieren, damit results[-1] das neueste Jahr ist
+                        results.sort(key=lambda r: r.get("Year") or 0)
+
+                        st.session_state["mos_last_key"] = run_key
+                        st.session_state["mos_last_results"] = results
 
                     if results:
                         st.success(get_text("mos.analysis_completed").format(ticker))
 
-                        latest_year = max(years)
-
-                        table_data = []
-                        for r in results:
-                            row = {
-                                get_text("common.year"): r.get("Year"),
-                                get_text("mos.eps"): f"${r.get('EPS_now', 0):.2f}",
-                                get_text(
-                                    "mos.fair_value_today"
-                                ): f"${r.get('Fair Value Today', 0):,.2f}",
-                                get_text(
-                                    "mos.buy_price"
-                                ): f"${r.get('MOS Price', 0):,.2f}",
-                            }
+                        latest_year = int(years.max())
 
-                            if r.get("Year") == latest_year:
-                                row[get_text("common.current_stock_price")] = (
-                                    f"${r.get('Current Stock Price', 0):,.2f}"
-                                )
-                                row[get_text("mos.valuation")] = r.get(
-                                    "Price vs Fair Value", "N/A"
-                                )
+                        year_col = get_text("common.year")
+                        eps_col = get_text("mos.eps")
+                        fair_value_col = get_text("mos.fair_value_today")
+                        buy_price_col = get_text("mos.buy_price")
+                        price_col = get_text("common.current_stock_price")
+                        valuation_col = get_text("mos.valuation")
 
-                            table_data.append(row)
+                        result_years = np.array([r.get("Year") for r in results])
+                        df = pd.DataFrame(
+                            {
+                                year_col: result_years,
+                                eps_col: np.array(
+                                    [r.get("EPS_now", 0.0) for r in results],
+                                    dtype=float,
+                                ),
+                                fair_value_col: np.array(
+                                    [r.get("Fair Value Today", 0.0) for r in results],
+                                    dtype=float,
+                                ),
+                                buy_price_col: np.array(
+                                    [r.get("MOS Price", 0.0) for r in results],
+                                    dtype=float,
+                                ),
+                            }
+                        )
 
-                        df = pd.DataFrame(table_data)
-                        st.dataframe(df, use_container_width=True, hide_index=True)
+                        # Aktueller Kurs nur für das neueste Jahr
+                        is_latest = result_years == latest_year
+                        if is_latest.any():
+                            df[price_col] = np.where(
+                                is_latest,
+                                [r.get("Current Stock Price", 0.0) for r in results],
+                                np.nan,
+                            )
+                            df[valuation_col] = [
+                                r.get("Price vs Fair Value", "N/A") if latest else None
+                                for r, latest in zip(results, is_latest)
+                            ]
+
+                        st.dataframe(
+                            df,
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                eps_col: st.column_config.NumberColumn(format="$%.2f"),
+                                fair_value_col: st.column_config.NumberColumn(
+                                    format="dollar"
+                                ),
+                                buy_price_col: st.column_config.NumberColumn(
+                                    format="dollar"
+                                ),
+                                price_col: st.column_config.NumberColumn(
+                                    format="dollar"
+                                ),
+                            },
+                        )
 
                         if multi_year:
                             st.info(
@@ -182,14 +255,10 @@ def show_mos_analysis():
                         recommendation = latest.get("Investment Recommendation", "N/A")
 
                         st.markdown(f"### {get_text('mos.investment_recommendation')}")
-                        if "Strong Buy" in recommendation:
-                            st.success(f"🚀 {recommendation}")
-                        elif "Buy" in recommendation:
-                            st.success(f"✅ {recommendation}")
-                        elif "Hold" in recommendation:
-                            st.warning(f"⚖️ {recommendation}")
-                        else:
-                            st.error(f"❌ {recommendation}")
+                        emoji, render = _REC_RENDER.get(
+                            latest.get("recommendation_code"), ("❌", st.error)
+                        )
+                        render(f"{emoji} {recommendation}")
 
                     else:
                         st.warning(get_text("common.no_valid_data"))
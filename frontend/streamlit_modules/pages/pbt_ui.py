@@ -1,14 +1,102 @@
+import re
 import streamlit as st
+import numpy as np
 import pandas as pd
-from ..config import get_text, save_persistence_data, capture_output
-import backend.logic.pbt as pbt_logic
+from ..config import (
+    get_text,
+    mark_persist_dirty,
+    update_persist_section,
+    flush_persistence_data,
+    capture_output,
+)
+
+# Trennzeile zwischen den Jahres-Reports von print_pbt_analysis_multi
+_YEAR_MARKER = re.compile(r"^=== Year (\d+) ===$", re.MULTILINE)
+
+# Darstellung von Bewertung und Empfehlung je Code aus backend.logic.pbt
+_VAL_RENDER = {
+    "below_buy": ("📈", st.success),
+    "below_fair": ("✅", st.info),
+    "overvalued": ("📉", st.warning),
+}
+_REC_RENDER = {
+    "strong_buy": ("🚀", st.success),
+    "buy": ("✅", st.success),
+    "hold": ("⚖️", st.warning),
+    "sell": ("❌", st.error),
+}
+
+# Ergebnisfelder der Tabellenspalten FCF, Kaufpreis, Fair Value
+_TABLE_FIELDS = ("fcf_per_share", "buy_price", "fair_value")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _key_metrics(symbol):
+    """Key Metrics je Ticker einmal laden; jeder Aufruf erhält eine eigene Kopie"""
+    from backend.api import fmp_api
+
+    return fmp_api.get_key_metrics(symbol, limit=20)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_pbt_multi_year(ticker, years, growth_rate):
+    """Gecachte PBT-Berechnung aller Jahre je (Ticker, Jahre, Wachstumsrate)"""
+    import backend.logic.pbt as pbt_logic
+
+    return pbt_logic.calculate_pbt_multi_year(
+        ticker, list(years), growth_rate, key_metrics=_key_metrics(ticker)
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_pbt_with_comparison(ticker, year, growth_rate):
+    """Gecachte PBT-Berechnung je (Ticker, Jahr, Wachstumsrate)"""
+    import backend.logic.pbt as pbt_logic
+
+    return pbt_logic.calculate_pbt_with_comparison(
+        ticker, year, growth_rate, key_metrics=_key_metrics(ticker)
+    )
+
+
+_TEXT_KEYS = (
+    "pbt.title",
+    "pbt.description",
+    "common.use_individual_ticker",
+    "common.ticker_symbol",
+    "common.global_ticker_help",
+    "common.multi_year_checkbox",
+    "pbt.details_checkbox",
+    "common.from_year",
+    "common.to_year",
+    "common.year",
+    "pbt.growth_rate",
+    "pbt.run_analysis",
+    "common.please_enter_ticker",
+    "common.start_year_before_end",
+    "pbt.calculating",
+    "pbt.no_details_available",
+    "pbt.fcf_per_share",
+    "pbt.buy_price_8y",
+    "pbt.fair_value_2x",
+    "common.current_stock_price",
+    "pbt.price_comparison",
+    "common.current_price_comparison_info",
+    "pbt.analysis_for",
+    "pbt.calculation_info_simple",
+    "pbt.analysis_completed",
+    "pbt.analysis_failed",
+    "common.error_for_year",
+    "common.could_not_fetch_current_price",
+)
 
 
 def show_pbt_analysis():
     """Payback Time Analysis Interface with global ticker support and multi-year"""
+    # Alle Texte einmal pro Rerun auflösen
+    T = {k: get_text(k) for k in _TEXT_KEYS}
 
-    st.header(f"⏰ {get_text('pbt.title')}")
-    st.write(get_text("pbt.description"))
+    st.header(f"⏰ {T['pbt.title']}")
+    st.write(T["pbt.description"])
 
     persist_data = st.session_state.persist.get("PBT", {})
 
@@ -17,96 +105,105 @@ def show_pbt_analysis():
             "global_ticker", "MSFT"
         )
 
-    use_individual_ticker = st.checkbox(
-        get_text("common.use_individual_ticker"),
-        value=persist_data.get("use_individual_ticker", False),
-        key="pbt_use_individual",
-    )
-
+    # Modus-Schalter ausserhalb des Formulars, da sie das Layout umschalten
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        if use_individual_ticker:
-            ticker = st.text_input(
-                get_text("common.ticker_symbol"),
-                value=persist_data.get("ticker", ""),
-                key="pbt_ticker",
-            ).upper()
-        else:
-            ticker = st.text_input(
-                get_text("common.ticker_symbol") + " 🌍",
-                value=st.session_state.global_ticker,
-                key="pbt_ticker_global",
-                help=get_text("common.global_ticker_help"),
-            ).upper()
-            if ticker != st.session_state.global_ticker:
-                st.session_state.global_ticker = ticker
-                st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
+        use_individual_ticker = st.checkbox(
+            T["common.use_individual_ticker"],
+            value=persist_data.get("use_individual_ticker", False),
+            key="pbt_use_individual",
+        )
 
     with col2:
         multi_year = st.checkbox(
-            get_text("common.multi_year_checkbox"),
+            T["common.multi_year_checkbox"],
             value=persist_data.get("multi_year", False),
             key="pbt_multi",
         )
 
     with col3:
         show_details = st.checkbox(
-            get_text("pbt.details_checkbox"),
+            T["pbt.details_checkbox"],
             value=persist_data.get("show_details", False),
             key="pbt_details",
         )
 
-    col1, col2 = st.columns(2)
+    with st.form("pbt_form", clear_on_submit=False):
+        if use_individual_ticker:
+            ticker = st.text_input(
+                T["common.ticker_symbol"],
+                value=persist_data.get("ticker", ""),
+                key="pbt_ticker",
+            ).upper()
+        else:
+            ticker = st.text_input(
+                T["common.ticker_symbol"] + " 🌍",
+                value=st.session_state.global_ticker,
+                key="pbt_ticker_global",
+                help=T["common.global_ticker_help"],
+            ).upper()
 
-    with col1:
-        if multi_year:
-            subcol1, subcol2 = st.columns(2)
-            with subcol1:
-                start_year = st.number_input(
-                    get_text("common.from_year"),
-                    min_value=1990,
-                    max_value=2030,
-                    value=int(persist_data.get("start_year", 2020)),
-                    key="pbt_start",
-                )
-            with subcol2:
-                end_year = st.number_input(
-                    get_text("common.to_year"),
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if multi_year:
+                subcol1, subcol2 = st.columns(2)
+                with subcol1:
+                    start_year = st.number_input(
+                        T["common.from_year"],
+                        min_value=1990,
+                        max_value=2030,
+                        value=int(persist_data.get("start_year", 2020)),
+                        key="pbt_start",
+                    )
+                with subcol2:
+                    end_year = st.number_input(
+                        T["common.to_year"],
+                        min_value=1990,
+                        max_value=2030,
+                        value=int(persist_data.get("end_year", 2024)),
+                        key="pbt_end",
+                    )
+                years = list(range(start_year, end_year + 1))
+            else:
+                single_year = st.number_input(
+                    T["common.year"],
                     min_value=1990,
                     max_value=2030,
-                    value=int(persist_data.get("end_year", 2024)),
-                    key="pbt_end",
+                    value=int(persist_data.get("single_year", 2024)),
+                    key="pbt_single",
                 )
-            years = list(range(start_year, end_year + 1))
-        else:
-            single_year = st.number_input(
-                get_text("common.year"),
-                min_value=1990,
-                max_value=2030,
-                value=int(persist_data.get("single_year", 2024)),
-                key="pbt_single",
+                years = [single_year]
+
+        with col2:
+            growth_rate = st.number_input(
+                T["pbt.growth_rate"],
+                min_value=0.0,
+                max_value=100.0,
+                value=float(persist_data.get("growth_rate", 13.0)),
+                step=0.1,
+                key="pbt_growth",
             )
-            years = [single_year]
 
-    with col2:
-        growth_rate = st.number_input(
-            get_text("pbt.growth_rate"),
-            min_value=0.0,
-            max_value=100.0,
-            value=float(persist_data.get("growth_rate", 13.0)),
-            step=0.1,
-            key="pbt_growth",
-        )
+        submitted = st.form_submit_button(T["pbt.run_analysis"], key="pbt_run_button")
 
-    if st.button(get_text("pbt.run_analysis"), key="pbt_run_button"):
+    # Global Ticker nur vormerken; geschrieben wird beim Run-Klick oder Seitenwechsel
+    if not use_individual_ticker and ticker != st.session_state.global_ticker:
+        st.session_state.global_ticker = ticker
+        st.session_state.persist["global_ticker"] = ticker
+        mark_persist_dirty()
+
+    if submitted:
         if not ticker:
-            st.error(get_text("common.please_enter_ticker"))
+            st.error(T["common.please_enter_ticker"])
         elif multi_year and start_year >= end_year:
-            st.error(get_text("common.start_year_before_end"))
+            st.error(T["common.start_year_before_end"])
         else:
-            with st.spinner(get_text("pbt.calculating").format(ticker)):
+            # Backend erst beim ersten Klick laden
+            import backend.logic.pbt as pbt_logic
+
+            with st.spinner(T["pbt.calculating"].format(ticker)):
                 try:
                     persist_update = {
                         "ticker": ticker if use_individual_ticker else "",
@@ -122,191 +219,180 @@ def show_pbt_analysis():
                     else:
                         persist_update["single_year"] = str(single_year)
 
-                    st.session_state.persist.setdefault("PBT", {}).update(
-                        persist_update
-                    )
-                    save_persistence_data()
+                    # Nur schreiben, wenn sich Eingaben oder Global Ticker geändert haben
+                    update_persist_section("PBT", persist_update)
+                    flush_persistence_data()
 
                     if show_details:
                         current_language_data = st.session_state.get("language", {})
 
+                        # Ein Aufruf und ein Buffer für alle Jahre
+                        _, output = capture_output(
+                            pbt_logic.print_pbt_analysis_multi,
+                            ticker,
+                            years,
+                            growth_rate / 100,
+                            current_language_data,
+                            key_metrics=_key_metrics(ticker),
+                        )
+                        parts = _YEAR_MARKER.split(output)
+                        reports = dict(zip(map(int, parts[1::2]), parts[2::2]))
+
                         for year in years:
-                            try:
-                                _, output = capture_output(
-                                    pbt_logic.print_pbt_analysis,
-                                    ticker,
-                                    year,
-                                    growth_rate / 100,
-                                    current_language_data,
-                                )
-                                if output.strip():
-                                    st.code(output, language=None)
-                                else:
-                                    st.warning(
-                                        get_text("pbt.no_details_available").format(
-                                            year
-                                        )
-                                    )
-                            except Exception as e:
-                                st.error(
-                                    get_text("common.error_for_year").format(
-                                        year, str(e)
-                                    )
-                                )
+                            report = reports.get(year, "")
+                            if report.strip():
+                                st.code(report, language=None)
+                            else:
+                                st.warning(T["pbt.no_details_available"].format(year))
                     else:
-                        results = []
                         latest_year = max(years)
                         current_price_data = None
 
+                        # Ein Backend-Aufruf für alle Jahre (inkl. neuestem Jahr);
+                        # schlägt er fehl, Jahr für Jahr rechnen, damit nur die
+                        # betroffenen Jahre fehlen
+                        year_errors = {}
                         try:
-                            latest_result = pbt_logic.calculate_pbt_with_comparison(
-                                ticker, latest_year, growth_rate / 100
+                            batch = _cached_pbt_multi_year(
+                                ticker, tuple(years), growth_rate / 100
                             )
-                            if (
-                                latest_result
-                                and latest_result.get("current_stock_price") is not None
-                            ):
-                                current_price_data = {
-                                    "price": latest_result["current_stock_price"],
-                                    "buy_price": latest_result.get("buy_price"),
-                                    "fair_value": latest_result.get("fair_value"),
-                                    "comparison": latest_result.get(
-                                        "price_comparison", "N/A"
-                                    ),
-                                    "recommendation": latest_result.get(
-                                        "investment_recommendation", "N/A"
-                                    ),
-                                }
-                        except Exception as e:
+                        except Exception:
+                            batch = {}
+                            for year in years:
+                                try:
+                                    batch[year] = _cached_pbt_with_comparison(
+                                        ticker, year, growth_rate / 100
+                                    )
+                                except Exception as e:
+                                    year_errors[year] = str(e)
+
+                        if latest_year in year_errors:
                             st.warning(
-                                get_text("common.could_not_fetch_current_price").format(
-                                    str(e)
+                                T["common.could_not_fetch_current_price"].format(
+                                    year_errors[latest_year]
                                 )
                             )
 
-                        for year in years:
-                            try:
-                                result_data = pbt_logic.calculate_pbt_with_comparison(
-                                    ticker, year, growth_rate / 100
-                                )
-
-                                if result_data:
-                                    buy_price = result_data.get("buy_price")
-                                    fair_value = result_data.get("fair_value")
-                                    fcf = result_data.get("fcf_per_share")
-
-                                    row = {
-                                        get_text("common.year"): year,
-                                        get_text("pbt.fcf_per_share"): f"${fcf:,.2f}"
-                                        if fcf
-                                        else "N/A",
-                                        get_text(
-                                            "pbt.buy_price_8y"
-                                        ): f"${buy_price:,.2f}" if buy_price else "N/A",
-                                        get_text(
-                                            "pbt.fair_value_2x"
-                                        ): f"${fair_value:,.2f}"
-                                        if fair_value
-                                        else "N/A",
-                                    }
-
-                                    if year == latest_year and current_price_data:
-                                        row[get_text("common.current_stock_price")] = (
-                                            f"${current_price_data['price']:,.2f}"
-                                        )
-                                        row[get_text("pbt.price_comparison")] = (
-                                            current_price_data["comparison"]
-                                        )
-
-                                    results.append(row)
-                                else:
-                                    results.append(
-                                        {
-                                            get_text("common.year"): year,
-                                            get_text("pbt.fcf_per_share"): "N/A",
-                                            get_text("pbt.buy_price_8y"): "N/A",
-                                            get_text("pbt.fair_value_2x"): "N/A",
-                                        }
-                                    )
-
-                            except Exception as e:
-                                results.append(
-                                    {
-                                        get_text("common.year"): year,
-                                        get_text(
-                                            "pbt.fcf_per_share"
-                                        ): f"{get_text('common.error')}: {str(e)}",
-                                        get_text(
-                                            "pbt.buy_price_8y"
-                                        ): f"{get_text('common.error')}: {str(e)}",
-                                        get_text(
-                                            "pbt.fair_value_2x"
-                                        ): f"{get_text('common.error')}: {str(e)}",
-                                    }
-                                )
+                        latest_result = batch.get(latest_year)
+                        if (
+                            latest_result
+                            and latest_result.get("current_stock_price") is not None
+                        ):
+                            current_price_data = {
+                                "price": latest_result["current_stock_price"],
+                                "buy_price": latest_result.get("buy_price"),
+                                "fair_value": latest_result.get("fair_value"),
+                                "comparison": latest_result.get(
+                                    "price_comparison", "N/A"
+                                ),
+                                "valuation_code": latest_result.get("valuation_code"),
+                                "recommendation": latest_result.get(
+                                    "investment_recommendation", "N/A"
+                                ),
+                                "recommendation_code": latest_result.get(
+                                    "recommendation_code"
+                                ),
+                            }
+
+                        year_col = T["common.year"]
+                        fcf_col = T["pbt.fcf_per_share"]
+                        buy_col = T["pbt.buy_price_8y"]
+                        fair_col = T["pbt.fair_value_2x"]
+                        price_col = T["common.current_stock_price"]
+
+                        for year, error in year_errors.items():
+                            st.warning(T["common.error_for_year"].format(year, error))
+
+                        # Vorbelegte NaN-Matrix in einem Durchlauf füllen;
+                        # formatiert wird per column_config
+                        values = np.full((len(years), len(_TABLE_FIELDS)), np.nan)
+                        for i, year in enumerate(years):
+                            result_data = batch.get(year)
+                            if result_data:
+                                values[i] = [result_data.get(f) for f in _TABLE_FIELDS]
+
+                        results = {
+                            year_col: np.asarray(years, dtype="int32"),
+                            fcf_col: values[:, 0],
+                            buy_col: values[:, 1],
+                            fair_col: values[:, 2],
+                        }
+                        if current_price_data:
+                            is_latest = results[year_col] == latest_year
+                            results[price_col] = np.where(
+                                is_latest, current_price_data["price"], np.nan
+                            )
+                            results[T["pbt.price_comparison"]] = np.where(
+                                is_latest, current_price_data["comparison"], None
+                            )
 
                         if results:
                             if len(years) == 1 and current_price_data:
-                                st.subheader(
-                                    get_text("pbt.analysis_for").format(ticker)
-                                )
+                                st.subheader(T["pbt.analysis_for"].format(ticker))
 
                                 col1, col2, col3, col4 = st.columns(4)
 
                                 with col1:
                                     st.metric(
-                                        get_text("pbt.buy_price_8y"),
+                                        T["pbt.buy_price_8y"],
                                         f"${current_price_data['buy_price']:,.2f}",
                                     )
 
                                 with col2:
                                     st.metric(
-                                        get_text("pbt.fair_value_2x"),
+                                        T["pbt.fair_value_2x"],
                                         f"${current_price_data['fair_value']:,.2f}",
                                     )
 
                                 with col3:
                                     st.metric(
-                                        get_text("common.current_stock_price"),
+                                        T["common.current_stock_price"],
                                         f"${current_price_data['price']:,.2f}",
                                     )
 
                                 with col4:
-                                    valuation = current_price_data["comparison"]
-                                    if "Below buy price" in valuation:
-                                        st.success(f"📈 {valuation}")
-                                    elif "Below fair value" in valuation:
-                                        st.info(f"✅ {valuation}")
-                                    elif "Overvalued" in valuation:
-                                        st.warning(f"📉 {valuation}")
-                                    else:
-                                        st.info(f"⚖️ {valuation}")
-
-                                    recommendation = current_price_data[
-                                        "recommendation"
-                                    ]
-                                    if "Strong Buy" in recommendation:
-                                        st.success(f"🚀 {recommendation}")
-                                    elif "Buy" in recommendation:
-                                        st.success(f"✅ {recommendation}")
-                                    elif "Hold" in recommendation:
-                                        st.warning(f"⚖️ {recommendation}")
-                                    else:
-                                        st.error(f"❌ {recommendation}")
-
-                                st.info(get_text("pbt.calculation_info_simple"))
-
-                            df = pd.DataFrame(results)
-                            st.dataframe(df, use_container_width=True, hide_index=True)
+                                    emoji, render = _VAL_RENDER.get(
+                                        current_price_data["valuation_code"],
+                                        ("⚖️", st.info),
+                                    )
+                                    render(
+                                        f"{emoji} {current_price_data['comparison']}"
+                                    )
+
+                                    emoji, render = _REC_RENDER.get(
+                                        current_price_data["recommendation_code"],
+                                        ("❌", st.error),
+                                    )
+                                    render(
+                                        f"{emoji} {current_price_data['recommendation']}"
+                                    )
+
+                                st.info(T["pbt.calculation_info_simple"])
+
+                            money = st.column_config.NumberColumn(format="dollar")
+                            st.dataframe(
+                                pd.DataFrame(results),
+                                use_container_width=True,
+                                hide_index=True,
+                                column_config={
+                                    year_col: st.column_config.NumberColumn(
+                                        format="%d"
+                                    ),
+                                    fcf_col: money,
+                                    buy_col: money,
+                                    fair_col: money,
+                                    price_col: money,
+                                },
+                            )
 
                             if multi_year and current_price_data:
                                 st.info(
-                                    get_text(
-                                        "common.current_price_comparison_info"
-                                    ).format(latest_year)
+                                    T["common.current_price_comparison_info"].format(
+                                        latest_year
+                                    )
                                 )
 
-                    st.success(get_text("pbt.analysis_completed").format(ticker))
+                    st.success(T["pbt.analysis_completed"].format(ticker))
 
                 except Exception as e:
-                    st.error(get_text("pbt.analysis_failed").format(str(e)))
+                    st.error(T["pbt.analysis_failed"].format(str(e)))
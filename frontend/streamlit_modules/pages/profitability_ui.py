@@ -1,65 +1,226 @@
+import bisect
+import functools
+import operator
+from collections import OrderedDict
 import streamlit as st
-from ..config import get_text, save_persistence_data
-import backend.logic.profitability as profitability_logic
-
-
-def _get_return_rating(ratio, metric_type):
-    """Helper function to get rating for return ratios (ROE, ROA)"""
-    if ratio is None:
-        return "N/A", "info"
-
-    if metric_type == "roe":
-        if ratio >= 0.20:
-            return get_text("profitability.rating_excellent"), "success"
-        elif ratio >= 0.15:
-            return get_text("profitability.rating_very_good"), "success"
-        elif ratio >= 0.10:
-            return get_text("profitability.rating_good"), "info"
-        elif ratio >= 0.05:
-            return get_text("profitability.rating_acceptable"), "warning"
-        else:
-            return get_text("profitability.rating_poor"), "error"
-
-    elif metric_type == "roa":
-        if ratio >= 0.10:
-            return get_text("profitability.rating_excellent"), "success"
-        elif ratio >= 0.07:
-            return get_text("profitability.rating_very_good"), "success"
-        elif ratio >= 0.05:
-            return get_text("profitability.rating_good"), "info"
-        elif ratio >= 0.03:
-            return get_text("profitability.rating_acceptable"), "warning"
-        else:
-            return get_text("profitability.rating_poor"), "error"
-
-    elif metric_type == "roic":
-        if ratio >= 0.15:
-            return get_text("profitability.rating_excellent"), "success"
-        elif ratio >= 0.12:
-            return get_text("profitability.rating_very_good"), "success"
-        elif ratio >= 0.08:
-            return get_text("profitability.rating_good"), "info"
-        elif ratio >= 0.05:
-            return get_text("profitability.rating_acceptable"), "warning"
-        else:
-            return get_text("profitability.rating_poor"), "error"
+import numpy as np
+import pandas as pd
+from ..config import (
+    get_text,
+    mark_persist_dirty,
+    update_persist_section,
+    flush_persistence_data,
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_single(ticker, year):
+    """Gecachte Einjahres-Kennzahlen je (Ticker, Jahr)"""
+    import backend.logic.profitability as profitability_logic
+
+    return profitability_logic.calculate_profitability_metrics_from_ticker(ticker, year)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_multi(ticker, start_year, end_year):
+    """Gecachte Mehrjahres-Kennzahlen je (Ticker, Von, Bis)"""
+    import backend.logic.profitability as profitability_logic
+
+    return profitability_logic.calculate_profitability_metrics_multi_year(
+        ticker, start_year, end_year
+    )
+
+
+_SESSION_MEMO_SIZE = 8
+
+
+def _session_memo(key, compute):
+    """Letzte Ergebnisse dieser Session ohne Cache-Hashing wiederverwenden (LRU)"""
+    memo = st.session_state.setdefault("_profit_last", OrderedDict())
+    if key in memo:
+        memo.move_to_end(key)
+        return memo[key]
+
+    value = compute()
+    memo[key] = value
+    if len(memo) > _SESSION_MEMO_SIZE:
+        memo.popitem(last=False)
+    return value
 
 
-def _get_margin_rating(margin):
-    """Helper function to get rating for profit margins"""
-    if margin is None:
-        return "N/A", "info"
+# Bewertungsstufen aufsteigend; Index = Anzahl erreichter Schwellen
+_RATING_KEYS = (
+    "profitability.rating_poor",
+    "profitability.rating_acceptable",
+    "profitability.rating_good",
+    "profitability.rating_very_good",
+    "profitability.rating_excellent",
+)
+_RATING_STATUS = ("error", "warning", "info", "success", "success")
 
-    if margin >= 0.20:
-        return get_text("profitability.rating_excellent"), "success"
-    elif margin >= 0.15:
-        return get_text("profitability.rating_very_good"), "success"
-    elif margin >= 0.10:
-        return get_text("profitability.rating_good"), "info"
-    elif margin >= 0.05:
-        return get_text("profitability.rating_acceptable"), "warning"
-    else:
-        return get_text("profitability.rating_poor"), "error"
+_THRESHOLDS = {
+    "roe": (0.05, 0.10, 0.15, 0.20),
+    "roa": (0.03, 0.05, 0.07, 0.10),
+    "roic": (0.05, 0.08, 0.12, 0.15),
+    "margin": (0.05, 0.10, 0.15, 0.20),
+    # Durchschnittlicher Score der Mehrjahres-Tabelle
+    "score": (0.4, 0.7, 1.0, 1.2),
+}
+
+
+def _make_rater(thresholds):
+    """Bewertungsfunktion mit fest eingebundener Schwellen-Tabelle"""
+    bisect_right = bisect.bisect_right
+
+    def rate(value):
+        if value is None:
+            return "N/A", "info"
+
+        i = bisect_right(thresholds, value)
+        return get_text(_RATING_KEYS[i]), _RATING_STATUS[i]
+
+    return rate
+
+
+_rate_roe = _make_rater(_THRESHOLDS["roe"])
+_rate_roa = _make_rater(_THRESHOLDS["roa"])
+_rate_roic = _make_rater(_THRESHOLDS["roic"])
+_rate_margin = _make_rater(_THRESHOLDS["margin"])
+
+
+# Status -> Streamlit-Ausgabe und Ampel-Emoji
+_STATUS_FN = {
+    "success": (st.success, "🟢"),
+    "info": (st.info, "🟡"),
+    "warning": (st.warning, "🟡"),
+    "error": (st.error, "🔴"),
+}
+
+
+def _render_rating(rating, status):
+    """Zeigt eine Bewertung im Stil ihres Status an"""
+    fn, emoji = _STATUS_FN[status]
+    fn(f"{emoji} {rating}")
+
+
+@functools.lru_cache(maxsize=8)
+def _threshold_markdown(explanation, metric_titles, labels):
+    """Schwellenwert-Erklärung als ein Markdown-Block, einmal pro Textsatz gebaut
+
+    Die Texte werden vom Aufrufer aufgelöst, da get_text Session-Daten liest.
+    """
+    sections = [explanation]
+
+    for metric_type, title in zip(("roe", "roa", "roic"), metric_titles):
+        p = [f"{t * 100:g}" for t in _THRESHOLDS[metric_type]]
+        sections.append(
+            "\n".join(
+                [
+                    f"**{title}:**",
+                    f"- ≥ {p[3]}%: {labels[4]}",
+                    f"- {p[2]}-{p[3]}%: {labels[3]}",
+                    f"- {p[1]}-{p[2]}%: {labels[2]}",
+                    f"- {p[0]}-{p[1]}%: {labels[1]}",
+                    f"- < {p[0]}%: {labels[0]}",
+                ]
+            )
+        )
+
+    return "\n\n".join(sections)
+
+
+# Beträge in Millionen, z.B. "$1,234.57M"
+_FMT_M = "${:,.2f}M".format
+
+# Absolutwerte der Detailansicht in einem Zugriff (fehlende Werte = 0)
+_DETAIL_KEYS = ("revenue", "net_income", "total_assets", "shareholders_equity")
+_DETAIL_DEFAULTS = dict.fromkeys(_DETAIL_KEYS, 0)
+_GET_DETAILS = operator.itemgetter(*_DETAIL_KEYS)
+
+# (Kennzahl, Bewertungsfunktion) je Karte der Einjahres-Ansicht
+_RETURN_CARDS = (("roe", _rate_roe), ("roa", _rate_roa), ("roic", _rate_roic))
+_MARGIN_CARDS = (
+    ("gross_margin", _rate_margin),
+    ("operating_margin", _rate_margin),
+    ("net_margin", _rate_margin),
+)
+
+
+def _render_metric_cards(result, cards):
+    """Zeigt Prozent-Kennzahlen mit Bewertung nebeneinander an"""
+    for col, (key, rate) in zip(st.columns(len(cards)), cards):
+        value = result.get(key)
+        with col:
+            st.metric(
+                get_text(f"profitability.{key}"),
+                f"{value * 100:.2f}%" if value is not None else "N/A",
+            )
+            _render_rating(*rate(value))
+
+
+# Kennzahl, Spaltenkopf, Faktor und Format der Mehrjahres-Tabelle
+# (ohne Jahr und Bewertung)
+_TABLE_COLUMNS = (
+    ("roe", "profitability.roe", 100, "%.1f%%"),
+    ("roa", "profitability.roa", 100, "%.1f%%"),
+    ("roic", "profitability.roic", 100, "%.1f%%"),
+    ("gross_margin", "profitability.gross_margin", 100, "%.1f%%"),
+    ("operating_margin", "profitability.operating_margin", 100, "%.1f%%"),
+    ("net_margin", "profitability.net_margin", 100, "%.1f%%"),
+    ("asset_turnover", "profitability.asset_turnover", 1, "%.2fx"),
+)
+_TABLE_KEYS = ("year",) + tuple(column[0] for column in _TABLE_COLUMNS)
+_TABLE_SCALES = np.array([column[2] for column in _TABLE_COLUMNS], dtype=float)
+
+
+# Kennzahlen der Gesamtbewertung und ihre Normwerte (Score 1.0 = Normwert)
+_SCORE_KEYS = ["roe", "roa", "net_margin"]
+_SCORE_NORMS = np.array([0.15, 0.07, 0.15])
+
+
+def _score_levels(df):
+    """Bewertungsstufe je Jahr aus ROE, ROA und Nettomarge (-1 = keine Daten)"""
+    scores = np.minimum(df[_SCORE_KEYS].to_numpy(dtype=float) / _SCORE_NORMS, 1.5)
+    counts = (~np.isnan(scores)).sum(axis=1)
+    avg = np.nansum(scores, axis=1) / np.maximum(counts, 1)
+
+    idx = np.searchsorted(_THRESHOLDS["score"], avg, side="right")
+    return np.where(counts > 0, idx, -1)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_profit_table(ticker, start_year, end_year):
+    """Formatierte Mehrjahres-Werte je Ticker und Zeitraum, ohne Sprachtexte"""
+    results = _cached_multi(ticker, start_year, end_year)
+    if not results:
+        return None
+
+    # Spaltenweise formatieren statt Zelle für Zelle
+    df = pd.DataFrame(results, columns=list(_TABLE_KEYS))
+    table = pd.DataFrame({"year": df["year"]})
+    values = df[list(_TABLE_KEYS[1:])].to_numpy(dtype=float) * _TABLE_SCALES
+    for j, (key, _, _, fmt) in enumerate(_TABLE_COLUMNS):
+        column = values[:, j]
+        table[key] = np.where(np.isnan(column), "N/A", np.char.mod(fmt, column))
+    table["rating"] = _score_levels(df)
+    return table
+
+
+def _profit_table(ticker, start_year, end_year):
+    """Mehrjahres-Tabelle mit Spaltenköpfen und Bewertungen der Session-Sprache"""
+    table = _cached_profit_table(ticker, start_year, end_year)
+    if table is None:
+        return None
+
+    labels = np.array(["N/A"] + [get_text(key) for key in _RATING_KEYS], dtype=object)
+    table = table.assign(rating=labels[table["rating"].to_numpy() + 1])
+    return table.rename(
+        columns={
+            "year": get_text("common.year"),
+            **{key: get_text(label_key) for key, label_key, _, _ in _TABLE_COLUMNS},
+            "rating": get_text("profitability.rating"),
+        }
+    )
 
 
 def show_profitability_analysis():
@@ -67,22 +228,31 @@ def show_profitability_analysis():
     st.header(f"💰 {get_text('profitability.title')}")
     st.write(get_text("profitability.description"))
 
-    persist_data = st.session_state.persist.get("PROFITABILITY", {})
-
-    if "global_ticker" not in st.session_state:
-        st.session_state.global_ticker = st.session_state.persist.get(
-            "global_ticker", "MSFT"
-        )
+    # Session State einmal binden statt über den Proxy mehrfach zu lesen
+    ss = st.session_state
+    persist = ss.persist
+    persist_data = persist.get("PROFITABILITY", {})
 
-    use_individual_ticker = st.checkbox(
-        get_text("common.use_individual_ticker"),
-        value=persist_data.get("use_individual_ticker", False),
-        key="profit_use_individual",
-    )
+    global_ticker = ss.setdefault("global_ticker", persist.get("global_ticker", "MSFT"))
 
-    col1, col2 = st.columns([3, 1])
+    # Modus-Schalter ausserhalb des Formulars, da sie das Layout umschalten
+    col1, col2 = st.columns(2)
 
     with col1:
+        use_individual_ticker = st.checkbox(
+            get_text("common.use_individual_ticker"),
+            value=persist_data.get("use_individual_ticker", False),
+            key="profit_use_individual",
+        )
+
+    with col2:
+        multi_year = st.checkbox(
+            get_text("common.multi_year_checkbox"),
+            value=persist_data.get("multi_year", True),
+            key="profit_multi_year",
+        )
+
+    with st.form("profitability_form", clear_on_submit=False):
         if use_individual_ticker:
             ticker = st.text_input(
                 get_text("common.ticker_symbol"),
@@ -92,160 +262,84 @@ def show_profitability_analysis():
         else:
             ticker = st.text_input(
                 get_text("common.ticker_symbol") + " 🌍",
-                value=st.session_state.global_ticker,
+                value=global_ticker,
                 key="profit_ticker_global",
                 help=get_text("common.global_ticker_help"),
             ).upper()
-            if ticker != st.session_state.global_ticker:
-                st.session_state.global_ticker = ticker
-                st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
 
-    with col2:
-        multi_year = st.checkbox(
-            get_text("common.multi_year_checkbox"),
-            value=persist_data.get("multi_year", True),
-            key="profit_multi_year",
-        )
-
-    if multi_year:
-        col1, col2 = st.columns(2)
-        with col1:
-            start_year = st.number_input(
-                get_text("common.from_year"),
-                min_value=1990,
-                max_value=2030,
-                value=int(persist_data.get("start_year", 2020)),
-                key="profit_start_year",
-            )
-        with col2:
-            end_year = st.number_input(
-                get_text("common.to_year"),
+        if multi_year:
+            col1, col2 = st.columns(2)
+            with col1:
+                start_year = st.number_input(
+                    get_text("common.from_year"),
+                    min_value=1990,
+                    max_value=2030,
+                    value=int(persist_data.get("start_year", 2020)),
+                    key="profit_start_year",
+                )
+            with col2:
+                end_year = st.number_input(
+                    get_text("common.to_year"),
+                    min_value=1990,
+                    max_value=2030,
+                    value=int(persist_data.get("end_year", 2024)),
+                    key="profit_end_year",
+                )
+        else:
+            year = st.number_input(
+                get_text("common.year"),
                 min_value=1990,
                 max_value=2030,
-                value=int(persist_data.get("end_year", 2024)),
-                key="profit_end_year",
+                value=int(persist_data.get("year", 2024)),
+                key="profit_year",
             )
-    else:
-        year = st.number_input(
-            get_text("common.year"),
-            min_value=1990,
-            max_value=2030,
-            value=int(persist_data.get("year", 2024)),
-            key="profit_year",
+
+        submitted = st.form_submit_button(
+            get_text("profitability.run_analysis"), key="profit_run"
         )
 
-    if st.button(get_text("profitability.run_analysis"), key="profit_run"):
+    # Global Ticker nur vormerken; geschrieben wird beim Run-Klick oder Seitenwechsel
+    if not use_individual_ticker and ticker != global_ticker:
+        ss.global_ticker = ticker
+        persist["global_ticker"] = ticker
+        mark_persist_dirty()
+
+    if submitted:
         if not ticker:
             st.error(get_text("common.please_enter_ticker"))
         else:
             with st.spinner(get_text("profitability.calculating").format(ticker)):
                 try:
+                    persist_update = {
+                        "ticker": ticker if use_individual_ticker else "",
+                        "use_individual_ticker": use_individual_ticker,
+                        "multi_year": multi_year,
+                    }
                     if multi_year:
-                        persist_data = {
-                            "ticker": ticker if use_individual_ticker else "",
-                            "use_individual_ticker": use_individual_ticker,
-                            "multi_year": True,
-                            "start_year": str(start_year),
-                            "end_year": str(end_year),
-                        }
-                        st.session_state.persist.setdefault("PROFITABILITY", {}).update(
-                            persist_data
+                        persist_update.update(
+                            {"start_year": str(start_year), "end_year": str(end_year)}
                         )
-                        save_persistence_data()
+                    else:
+                        persist_update["year"] = str(year)
+
+                    # Eine Schreiboperation pro Klick, nur bei echten Änderungen
+                    update_persist_section("PROFITABILITY", persist_update)
+                    flush_persistence_data()
 
-                        results = profitability_logic.calculate_profitability_metrics_multi_year(
-                            ticker, start_year, end_year
+                    if multi_year:
+                        language_code = ss.get("current_language")
+                        table_data = _session_memo(
+                            (ticker, start_year, end_year, language_code),
+                            lambda: _profit_table(ticker, start_year, end_year),
                         )
 
-                        if results:
+                        if table_data is not None:
                             st.success(
                                 get_text("profitability.analysis_completed").format(
                                     ticker
                                 )
                             )
 
-                            table_data = []
-                            for result in results:
-                                roe = result.get("roe", None)
-                                roa = result.get("roa", None)
-                                roic = result.get("roic", None)
-                                gross_margin = result.get("gross_margin", None)
-                                operating_margin = result.get("operating_margin", None)
-                                net_margin = result.get("net_margin", None)
-                                asset_turnover = result.get("asset_turnover", None)
-
-                                ratios = []
-                                if roe is not None:
-                                    ratios.append(min(roe / 0.15, 1.5))
-                                if roa is not None:
-                                    ratios.append(min(roa / 0.07, 1.5))
-                                if net_margin is not None:
-                                    ratios.append(min(net_margin / 0.15, 1.5))
-
-                                if ratios:
-                                    avg_score = sum(ratios) / len(ratios)
-                                    if avg_score >= 1.2:
-                                        rating = get_text(
-                                            "profitability.rating_excellent"
-                                        )
-                                    elif avg_score >= 1.0:
-                                        rating = get_text(
-                                            "profitability.rating_very_good"
-                                        )
-                                    elif avg_score >= 0.7:
-                                        rating = get_text("profitability.rating_good")
-                                    elif avg_score >= 0.4:
-                                        rating = get_text(
-                                            "profitability.rating_acceptable"
-                                        )
-                                    else:
-                                        rating = get_text("profitability.rating_poor")
-                                else:
-                                    rating = "N/A"
-
-                                table_data.append(
-                                    {
-                                        get_text("common.year"): result.get("year"),
-                                        get_text(
-                                            "profitability.roe"
-                                        ): f"{roe * 100:.1f}%"
-                                        if roe is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.roa"
-                                        ): f"{roa * 100:.1f}%"
-                                        if roa is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.roic"
-                                        ): f"{roic * 100:.1f}%"
-                                        if roic is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.gross_margin"
-                                        ): f"{gross_margin * 100:.1f}%"
-                                        if gross_margin is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.operating_margin"
-                                        ): f"{operating_margin * 100:.1f}%"
-                                        if operating_margin is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.net_margin"
-                                        ): f"{net_margin * 100:.1f}%"
-                                        if net_margin is not None
-                                        else "N/A",
-                                        get_text(
-                                            "profitability.asset_turnover"
-                                        ): f"{asset_turnover:.2f}x"
-                                        if asset_turnover is not None
-                                        else "N/A",
-                                        get_text("profitability.rating"): rating,
-                                    }
-                                )
-
                             st.dataframe(
                                 table_data, use_container_width=True, hide_index=True
                             )
@@ -258,19 +352,8 @@ def show_profitability_analysis():
                             st.warning(get_text("common.no_valid_data"))
 
                     else:
-                        persist_data = {
-                            "ticker": ticker if use_individual_ticker else "",
-                            "use_individual_ticker": use_individual_ticker,
-                            "multi_year": False,
-                            "year": str(year),
-                        }
-                        st.session_state.persist.setdefault("PROFITABILITY", {}).update(
-                            persist_data
-                        )
-                        save_persistence_data()
-
-                        result = profitability_logic.calculate_profitability_metrics_from_ticker(
-                            ticker, year
+                        result = _session_memo(
+                            (ticker, year), lambda: _cached_single(ticker, year)
                         )
 
                         if result:
@@ -283,133 +366,31 @@ def show_profitability_analysis():
                             st.subheader(
                                 f"📊 {get_text('profitability.return_ratios_section')}"
                             )
-                            col1, col2, col3 = st.columns(3)
-
-                            roe = result.get("roe", None)
-                            roa = result.get("roa", None)
-                            roic = result.get("roic", None)
-
-                            with col1:
-                                st.metric(
-                                    get_text("profitability.roe"),
-                                    f"{roe * 100:.2f}%" if roe is not None else "N/A",
-                                )
-                                rating, status = _get_return_rating(roe, "roe")
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
-
-                            with col2:
-                                st.metric(
-                                    get_text("profitability.roa"),
-                                    f"{roa * 100:.2f}%" if roa is not None else "N/A",
-                                )
-                                rating, status = _get_return_rating(roa, "roa")
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
-
-                            with col3:
-                                st.metric(
-                                    get_text("profitability.roic"),
-                                    f"{roic * 100:.2f}%" if roic is not None else "N/A",
-                                )
-                                rating, status = _get_return_rating(roic, "roic")
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
+                            _render_metric_cards(result, _RETURN_CARDS)
 
                             st.markdown("---")
 
                             st.subheader(
                                 f"📈 {get_text('profitability.profit_margins_section')}"
                             )
-                            col1, col2, col3 = st.columns(3)
-
-                            gross_margin = result.get("gross_margin", None)
-                            operating_margin = result.get("operating_margin", None)
-                            net_margin = result.get("net_margin", None)
-
-                            with col1:
-                                st.metric(
-                                    get_text("profitability.gross_margin"),
-                                    f"{gross_margin * 100:.2f}%"
-                                    if gross_margin is not None
-                                    else "N/A",
-                                )
-                                rating, status = _get_margin_rating(gross_margin)
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
-
-                            with col2:
-                                st.metric(
-                                    get_text("profitability.operating_margin"),
-                                    f"{operating_margin * 100:.2f}%"
-                                    if operating_margin is not None
-                                    else "N/A",
-                                )
-                                rating, status = _get_margin_rating(operating_margin)
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
-
-                            with col3:
-                                st.metric(
-                                    get_text("profitability.net_margin"),
-                                    f"{net_margin * 100:.2f}%"
-                                    if net_margin is not None
-                                    else "N/A",
-                                )
-                                rating, status = _get_margin_rating(net_margin)
-                                if status == "success":
-                                    st.success(f"🟢 {rating}")
-                                elif status == "info":
-                                    st.info(f"🟡 {rating}")
-                                elif status == "warning":
-                                    st.warning(f"🟡 {rating}")
-                                elif status == "error":
-                                    st.error(f"🔴 {rating}")
+                            _render_metric_cards(result, _MARGIN_CARDS)
 
                             st.markdown("---")
 
                             st.subheader(
                                 f"⚡ {get_text('profitability.efficiency_section')}"
                             )
-                            asset_turnover = result.get("asset_turnover", None)
+                            asset_turnover = result.get("asset_turnover")
 
                             col1, col2 = st.columns([1, 2])
                             with col1:
                                 st.metric(
                                     get_text("profitability.asset_turnover"),
-                                    f"{asset_turnover:.2f}x"
-                                    if asset_turnover is not None
-                                    else "N/A",
+                                    (
+                                        f"{asset_turnover:.2f}x"
+                                        if asset_turnover is not None
+                                        else "N/A"
+                                    ),
                                 )
 
                             with st.expander(
@@ -417,31 +398,31 @@ def show_profitability_analysis():
                             ):
                                 col1, col2 = st.columns(2)
 
-                                revenue = result.get("revenue", 0)
-                                net_income = result.get("net_income", 0)
-                                total_assets = result.get("total_assets", 0)
-                                shareholders_equity = result.get(
-                                    "shareholders_equity", 0
-                                )
+                                (
+                                    revenue,
+                                    net_income,
+                                    total_assets,
+                                    shareholders_equity,
+                                ) = _GET_DETAILS({**_DETAIL_DEFAULTS, **result})
 
                                 with col1:
                                     st.metric(
                                         get_text("profitability.revenue"),
-                                        f"${revenue / 1_000_000:,.2f}M",
+                                        _FMT_M(revenue / 1e6),
                                     )
                                     st.metric(
                                         get_text("profitability.total_assets"),
-                                        f"${total_assets / 1_000_000:,.2f}M",
+                                        _FMT_M(total_assets / 1e6),
                                     )
 
                                 with col2:
                                     st.metric(
                                         get_text("profitability.net_income"),
-                                        f"${net_income / 1_000_000:,.2f}M",
+                                        _FMT_M(net_income / 1e6),
                                     )
                                     st.metric(
                                         get_text("profitability.shareholders_equity"),
-                                        f"${shareholders_equity / 1_000_000:,.2f}M",
+                                        _FMT_M(shareholders_equity / 1e6),
                                     )
 
                             st.info(f"💡 {get_text('profitability.info_explanation')}")
@@ -449,59 +430,15 @@ def show_profitability_analysis():
                             with st.expander(
                                 f"📊 {get_text('profitability.threshold_info')}"
                             ):
-                                st.write(
-                                    get_text("profitability.threshold_explanation")
-                                )
-
-                                st.write(f"**{get_text('profitability.roe')}:**")
-                                st.write(
-                                    f"- ≥ 20%: {get_text('profitability.rating_excellent')}"
-                                )
-                                st.write(
-                                    f"- 15-20%: {get_text('profitability.rating_very_good')}"
-                                )
-                                st.write(
-                                    f"- 10-15%: {get_text('profitability.rating_good')}"
-                                )
-                                st.write(
-                                    f"- 5-10%: {get_text('profitability.rating_acceptable')}"
-                                )
-                                st.write(
-                                    f"- < 5%: {get_text('profitability.rating_poor')}"
-                                )
-
-                                st.write(f"\n**{get_text('profitability.roa')}:**")
-                                st.write(
-                                    f"- ≥ 10%: {get_text('profitability.rating_excellent')}"
-                                )
-                                st.write(
-                                    f"- 7-10%: {get_text('profitability.rating_very_good')}"
-                                )
-                                st.write(
-                                    f"- 5-7%: {get_text('profitability.rating_good')}"
-                                )
-                                st.write(
-                                    f"- 3-5%: {get_text('profitability.rating_acceptable')}"
-                                )
-                                st.write(
-                                    f"- < 3%: {get_text('profitability.rating_poor')}"
-                                )
-
-                                st.write(f"\n**{get_text('profitability.roic')}:**")
-                                st.write(
-                                    f"- ≥ 15%: {get_text('profitability.rating_excellent')}"
-                                )
-                                st.write(
-                                    f"- 12-15%: {get_text('profitability.rating_very_good')}"
-                                )
-                                st.write(
-                                    f"- 8-12%: {get_text('profitability.rating_good')}"
-                                )
-                                st.write(
-                                    f"- 5-8%: {get_text('profitability.rating_acceptable')}"
-                                )
-                                st.write(
-                                    f"- < 5%: {get_text('profitability.rating_poor')}"
+                                st.markdown(
+                                    _threshold_markdown(
+                                        get_text("profitability.threshold_explanation"),
+                                        tuple(
+                                            get_text(f"profitability.{metric_type}")
+                                            for metric_type in ("roe", "roa", "roic")
+                                        ),
+                                        tuple(get_text(key) for key in _RATING_KEYS),
+                                    )
                                 )
 
                         else:
@@ -6,7 +6,75 @@ View and manage screening jobs
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import time
+import traceback
+from collections import Counter
+
+# Status emoji for table and detail header
+_STATUS_EMOJI = {
+    "pending": "⏸️",
+    "running": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+    "cancelled": "🚫",
+}
+
+
+def queue_toast(message):
+    """Remember a toast for the next run, so it survives st.rerun()"""
+    st.session_state["screening_toast"] = message
+
+
+def show_queued_toast():
+    """Show (once) the toast remembered by queue_toast()"""
+    message = st.session_state.pop("screening_toast", None)
+    if message:
+        st.toast(message, icon="✅")
+
+
+@st.cache_resource
+def get_queue():
+    """Job queue shared across reruns and pages (connections are opened per call)"""
+    from backend.jobs.screening_queue import ScreeningJobQueue
+
+    return ScreeningJobQueue()
+
+
+@st.cache_resource
+def _get_worker():
+    """Worker for manual processing, built once instead of on every click"""
+    from backend.jobs.screening_worker import ScreeningWorker
+
+    return ScreeningWorker(poll_interval=0)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_user_jobs(user_id, limit=50):
+    """User's jobs, briefly cached so clicks between refreshes skip the DB.
+
+    Call fetch_user_jobs.clear() after anything that changes the queue.
+    """
+    return get_queue().get_user_jobs(user_id, limit=limit)
+
+
+def _set_has_active(has_active):
+    """Remember whether jobs are active; rerun the page to (un)set the timer"""
+    if st.session_state.get("jobs_has_active", True) != has_active:
+        st.session_state["jobs_has_active"] = has_active
+        st.rerun()
+
+
+def _reset_jobs_pages():
+    """Start again from the first page when the page size changes"""
+    st.session_state["jobs_pages"] = 1
+
+
+def _remember_selected_job(table_key, job_ids):
+    """Store the id of the row the user selected in the jobs table"""
+    rows = st.session_state[table_key].selection.rows
+    if rows and rows[0] < len(job_ids):
+        st.session_state["jobs_selected_id"] = job_ids[rows[0]]
+    else:
+        st.session_state.pop("jobs_selected_id", None)
 
 
 def show_screening_jobs_page():
@@ -20,6 +88,7 @@ def show_screening_jobs_page():
     )
 
     st.title("📊 My Screening Jobs")
+    show_queued_toast()
 
     col1, col2 = st.columns([2, 1])
 
@@ -33,52 +102,76 @@ def show_screening_jobs_page():
         # MANUAL PROCESS BUTTON
         if st.button("🔄 Process Jobs Now", help="Manually process pending jobs"):
             try:
-                from backend.jobs.screening_worker import ScreeningWorker
-
-                worker = ScreeningWorker(poll_interval=0)
+                worker = _get_worker()
 
                 # Process one job
                 worker._process_next_job()
+                fetch_user_jobs.clear()
 
-                st.success("✅ Processed pending job!")
-                time.sleep(0.5)
+                queue_toast("Processed pending job!")
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
 
     st.divider()
 
-    try:
-        from backend.jobs.screening_queue import ScreeningJobQueue
+    # Page size and auto-refresh toggle
+    col1, col2, col3 = st.columns([3, 1, 1])
 
-        queue = ScreeningJobQueue()
-        current_user = st.session_state.get("username", "default_user")
+    with col1:
+        st.subheader("Active & Recent Jobs")
 
-        # Auto-refresh toggle
-        col1, col2 = st.columns([3, 1])
+    with col2:
+        page_size = st.selectbox(
+            "Jobs per page",
+            options=[10, 25, 50],
+            index=0,
+            key="jobs_page_size",
+            on_change=_reset_jobs_pages,
+        )
+
+    with col3:
+        auto_refresh = st.checkbox(
+            "🔄 Auto-Refresh", value=True, help="Refresh every 10 seconds"
+        )
+
+    # Only the jobs panel reruns on the refresh timer, not the whole page, and
+    # only while jobs are pending or running (as seen by the last panel run)
+    has_active = st.session_state.get("jobs_has_active", True)
+    jobs_panel = st.fragment(
+        _jobs_panel, run_every=10 if auto_refresh and has_active else None
+    )
+    jobs_panel(page_size, auto_refresh)
 
-        with col1:
-            st.subheader("Active & Recent Jobs")
 
-        with col2:
-            auto_refresh = st.checkbox(
-                "🔄 Auto-Refresh", value=True, help="Refresh every 10 seconds"
-            )
+def _jobs_panel(page_size, auto_refresh):
+    """Job summary, table and details for the selected job"""
+    try:
+        queue = get_queue()
+        current_user = st.session_state.get("username", "default_user")
 
-        # Get user jobs
-        jobs = queue.get_user_jobs(current_user, limit=50)
+        # Get user jobs (only the pages loaded so far, plus one to detect more)
+        pages = st.session_state.setdefault("jobs_pages", 1)
+        visible = page_size * pages
+        jobs = fetch_user_jobs(current_user, limit=visible + 1)
+        has_more = len(jobs) > visible
+        jobs = jobs[:visible]
 
         if not jobs:
+            _set_has_active(False)
             st.info("📭 No screening jobs yet. Go back and submit your first job!")
             return
 
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
 
-        pending_count = len([j for j in jobs if j["status"] == "pending"])
-        running_count = len([j for j in jobs if j["status"] == "running"])
-        completed_count = len([j for j in jobs if j["status"] == "completed"])
-        failed_count = len([j for j in jobs if j["status"] == "failed"])
+        # Count all statuses in one pass
+        status_counts = Counter(j["status"] for j in jobs)
+        pending_count = status_counts["pending"]
+        running_count = status_counts["running"]
+        completed_count = status_counts["completed"]
+        failed_count = status_counts["failed"]
+        _set_has_active(pending_count + running_count > 0)
 
         with col1:
             st.metric("⏸️ Pending", pending_count)
@@ -91,148 +184,200 @@ def show_screening_jobs_page():
 
         st.divider()
 
-        # Display jobs
-        for job in jobs:
-            status = job["status"]
-
-            # Status emoji
-            status_emoji = {
-                "pending": "⏸️",
-                "running": "🔄",
-                "completed": "✅",
-                "failed": "❌",
-                "cancelled": "🚫",
-            }.get(status, "❓")
-
-            # Expandable job card
-            with st.expander(
-                f"{status_emoji} {job['strategy_name']} - {job['universe_name']} ({status.upper()})",
-                expanded=(status in ["running", "pending"]),
-            ):
-                col1, col2 = st.columns([2, 1])
-
-                with col1:
-                    st.markdown(f"**Job ID:** `{job['id'][:16]}...`")
-                    st.markdown(f"**Strategy:** {job['strategy_name']}")
-                    st.markdown(f"**Universe:** {job['universe_name']}")
-
-                    # Format timestamp
-                    try:
-                        dt = datetime.fromisoformat(job["created_at"])
-                        time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
-                        time_str = job["created_at"][:19]
-
-                    st.markdown(f"**Created:** {time_str}")
-
-                    # Progress
-                    if status == "running":
-                        progress = job.get("progress", 0)
-                        stocks_processed = job.get("stocks_processed", 0)
-                        stocks_total = job.get("stocks_total", 0)
-
-                        st.progress(progress / 100.0)
-                        st.caption(
-                            f"Progress: {stocks_processed}/{stocks_total} stocks ({progress}%)"
-                        )
-
-                    # Results summary
-                    if status == "completed" and job.get("result_summary"):
-                        summary = job["result_summary"]
-
-                        st.markdown("**Results:**")
-                        cols = st.columns(4)
-                        cols[0].metric("Total", summary.get("total_stocks", 0))
-                        cols[1].metric("🟢 BUY", summary.get("buy_count", 0))
-                        cols[2].metric("🟡 HOLD", summary.get("hold_count", 0))
-                        cols[3].metric("🔴 SELL", summary.get("sell_count", 0))
-
-                    # Error message
-                    if status == "failed" and job.get("error_message"):
-                        st.error(f"❌ Error: {job['error_message']}")
-
-                with col2:
-                    # Action buttons
-                    if status == "completed":
-                        if st.button(
-                            "📊 View Results",
-                            key=f"view_{job['id']}",
-                            use_container_width=True,
-                        ):
-                            # Load results into session state
-                            results_data = job.get("results")
-                            if results_data:
-                                # Results are already deserialized as list of dicts
-                                results_df = pd.DataFrame(results_data)
-
-                                st.session_state["screening_results"] = results_df
-                                st.session_state["screening_date"] = (
-                                    datetime.fromisoformat(job["completed_at"]).date()
-                                )
-                                st.session_state["screening_strategy"] = job[
-                                    "strategy_name"
-                                ]
-
-                                # ✅ NAVIGATE BACK TO SCREENING
-                                st.session_state["current_page"] = "screening"
-                                st.rerun()
-                            else:
-                                st.error("❌ No results data found for this job")
-
-                    elif status == "pending":
-                        if st.button(
-                            "❌ Cancel",
-                            key=f"cancel_{job['id']}",
-                            use_container_width=True,
-                        ):
-                            if queue.cancel_job(job["id"], current_user):
-                                st.success("✅ Job cancelled")
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to cancel")
-
-                    # Delete button
-                    if status in ["completed", "failed", "cancelled", "running"]:
-                        button_label = (
-                            "🗑️ Force Delete" if status == "running" else "🗑️ Delete"
-                        )
-                        button_help = (
-                            "Force delete stuck job"
-                            if status == "running"
-                            else "Delete this job"
-                        )
-
-                        if st.button(
-                            button_label,
-                            key=f"delete_{job['id']}",
-                            use_container_width=True,
-                            help=button_help,
-                        ):
-                            if queue.delete_job(job["id"], current_user):
-                                st.success("✅ Job deleted")
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to delete")
-
-        # Auto-refresh and auto-process
-        if auto_refresh and (running_count > 0 or pending_count > 0):
-            # AUTO-PROCESS pending jobs
-            if pending_count > 0:
-                try:
-                    from backend.jobs.screening_worker import ScreeningWorker
-
-                    worker = ScreeningWorker(poll_interval=0)
-                    worker._process_next_job()
-                except:
-                    pass  # Fail silently, will retry on next refresh
-
-            # Refresh UI
-            time.sleep(10)
+        # Overview table; details and actions only for the selected job
+        # Parse all timestamps in one pass; unparsable ones are shown truncated
+        created_at = pd.Series([j["created_at"] for j in jobs], dtype=object)
+        created = (
+            pd.to_datetime(created_at, format="ISO8601", errors="coerce")
+            .dt.strftime("%Y-%m-%d %H:%M:%S")
+            .fillna(created_at.str[:19])
+        )
+
+        jobs_df = pd.DataFrame(
+            {
+                "Status": [
+                    f"{_STATUS_EMOJI.get(j['status'], '❓')} {j['status'].upper()}"
+                    for j in jobs
+                ],
+                "Strategy": [j["strategy_name"] for j in jobs],
+                "Universe": [j["universe_name"] for j in jobs],
+                "Created": created,
+                "Progress": [
+                    100 if j["status"] == "completed" else j.get("progress") or 0
+                    for j in jobs
+                ],
+            }
+        )
+
+        # Selection is tracked by job id; rows shift when new jobs arrive, so
+        # the table is rebuilt (no stale highlight) whenever the list changes
+        job_ids = [j["id"] for j in jobs]
+        table_key = f"jobs_table_{hash(tuple(job_ids))}"
+
+        st.dataframe(
+            jobs_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select=lambda: _remember_selected_job(table_key, job_ids),
+            selection_mode="single-row",
+            key=table_key,
+            column_config={
+                "Progress": st.column_config.ProgressColumn(
+                    min_value=0, max_value=100, format="%d%%"
+                ),
+            },
+        )
+
+        if has_more and st.button("⬇️ Load more", key="jobs_load_more"):
+            st.session_state["jobs_pages"] = pages + 1
             st.rerun()
 
+        # Drop a selected job that is no longer listed (deleted, paged out)
+        selected_id = st.session_state.get("jobs_selected_id")
+        if selected_id not in job_ids:
+            st.session_state.pop("jobs_selected_id", None)
+            selected_id = None
+
+        # Default to the first active job, otherwise the most recent one
+        if selected_id:
+            job_idx = job_ids.index(selected_id)
+        else:
+            job_idx = next(
+                (
+                    i
+                    for i, j in enumerate(jobs)
+                    if j["status"] in ["running", "pending"]
+                ),
+                0,
+            )
+        job = jobs[job_idx]
+
+        status = job["status"]
+
+        with st.container(border=True):
+            st.markdown(
+                f"#### {_STATUS_EMOJI.get(status, '❓')} {job['strategy_name']} - "
+                f"{job['universe_name']} ({status.upper()})"
+            )
+
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                st.markdown(
+                    "\n\n".join(
+                        [
+                            f"**Job ID:** `{job['id'][:16]}...`",
+                            f"**Strategy:** {job['strategy_name']}",
+                            f"**Universe:** {job['universe_name']}",
+                            f"**Created:** {created.iat[job_idx]}",
+                        ]
+                    )
+                )
+
+                # Progress
+                if status == "running":
+                    progress = job.get("progress", 0)
+                    stocks_processed = job.get("stocks_processed", 0)
+                    stocks_total = job.get("stocks_total", 0)
+
+                    st.progress(progress / 100.0)
+                    st.caption(
+                        f"Progress: {stocks_processed}/{stocks_total} stocks ({progress}%)"
+                    )
+
+                # Results summary
+                if status == "completed" and job.get("result_summary"):
+                    summary = job["result_summary"]
+
+                    st.markdown("**Results:**")
+                    cols = st.columns(4)
+                    cols[0].metric("Total", summary.get("total_stocks", 0))
+                    cols[1].metric("🟢 BUY", summary.get("buy_count", 0))
+                    cols[2].metric("🟡 HOLD", summary.get("hold_count", 0))
+                    cols[3].metric("🔴 SELL", summary.get("sell_count", 0))
+
+                # Error message
+                if status == "failed" and job.get("error_message"):
+                    st.error(f"❌ Error: {job['error_message']}")
+
+            with col2:
+                # Action buttons
+                if status == "completed":
+                    if st.button(
+                        "📊 View Results",
+                        key=f"view_{job['id']}",
+                        use_container_width=True,
+                    ):
+                        # Load results into session state
+                        results_data = queue.get_job_results(job["id"])
+                        if results_data:
+                            # Results are deserialized as list of dicts
+                            results_df = pd.DataFrame(results_data)
+
+                            st.session_state["screening_results"] = results_df
+                            st.session_state["screening_date"] = datetime.fromisoformat(
+                                job["completed_at"]
+                            ).date()
+                            st.session_state["screening_strategy"] = job[
+                                "strategy_name"
+                            ]
+
+                            # ✅ NAVIGATE BACK TO SCREENING
+                            st.session_state["current_page"] = "screening"
+                            st.rerun()
+                        else:
+                            st.error("❌ No results data found for this job")
+
+                elif status == "pending":
+                    if st.button(
+                        "❌ Cancel",
+                        key=f"cancel_{job['id']}",
+                        use_container_width=True,
+                    ):
+                        if queue.cancel_job(job["id"], current_user):
+                            fetch_user_jobs.clear()
+                            st.success("✅ Job cancelled")
+                            st.rerun()
+                        else:
+                            st.error("❌ Failed to cancel")
+
+                # Delete button
+                if status in ["completed", "failed", "cancelled", "running"]:
+                    button_label = (
+                        "🗑️ Force Delete" if status == "running" else "🗑️ Delete"
+                    )
+                    button_help = (
+                        "Force delete stuck job"
+                        if status == "running"
+                        else "Delete this job"
+                    )
+
+                    if st.button(
+                        button_label,
+                        key=f"delete_{job['id']}",
+                        use_container_width=True,
+                        help=button_help,
+                    ):
+                        if queue.delete_job(job["id"], current_user):
+                            fetch_user_jobs.clear()
+                            st.success("✅ Job deleted")
+                            st.rerun()
+                        else:
+                            st.error("❌ Failed to delete")
+
+        # Pending jobs are processed by the background worker; only make sure
+        # it is alive instead of running jobs on the UI thread
+        if auto_refresh and pending_count > 0:
+            try:
+                from backend.jobs.worker_manager import get_worker_manager
+
+                manager = get_worker_manager()
+                if not manager.is_running():
+                    manager.start_worker(mode="polling")
+            except:
+                pass  # Fail silently, will retry on next refresh
+
     except Exception as e:
         st.error(f"❌ Error loading jobs: {str(e)}")
         with st.expander("🔍 Error Details"):
-            import traceback
-
             st.code(traceback.format_exc())
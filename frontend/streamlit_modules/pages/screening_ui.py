@@ -6,7 +6,64 @@ Screen S&P 500 with saved strategies
 import streamlit as st
 import pandas as pd
 from datetime import date
-import time
+import os
+import traceback
+from .screening_jobs_ui import (
+    fetch_user_jobs,
+    get_queue,
+    queue_toast,
+    show_queued_toast,
+    show_screening_jobs_page,
+)
+
+
+@st.cache_resource
+def _get_storage():
+    """Strategy storage shared across reruns (connections are opened per call)"""
+    from backend.storage.strategy_storage import StrategyStorage
+
+    return StrategyStorage()
+
+
+# Strategy lists longer than this get a filter; the dropdown shows at most
+# _STRATEGY_OPTIONS_MAX entries
+_STRATEGY_FILTER_MIN = 20
+_STRATEGY_OPTIONS_MAX = 50
+
+
+def _strategy_label(strategy):
+    """Selectbox label with shared/private indicator and backtest performance"""
+    # Add shared/private indicator
+    shared_icon = "🌍" if strategy.get("shared") else "📌"
+
+    # Add performance if available
+    perf = ""
+    if strategy.get("backtest_results"):
+        results = strategy["backtest_results"]
+        perf = f" - CAGR: {results.get('cagr', 0):.1f}%, Win: {results.get('win_rate', 0):.0f}%"
+
+    return f"{shared_icon} {strategy['name']}{perf}"
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_strategy_options(user_id, db_mtime):
+    """Label -> strategy for a user; db_mtime invalidates the cache after any write"""
+    strategies = _get_storage().get_strategies(user_id=user_id, include_shared=True)
+    return {_strategy_label(strategy): strategy for strategy in strategies}
+
+
+@st.cache_resource
+def _universe_options():
+    """Selectbox label -> universe info (static, built once per process)"""
+    from backend.backtesting.universe.definitions import list_universes
+
+    return {f"{u['name']} ({u['count']} stocks)": u for u in list_universes()}
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv(df):
+    """CSV bytes for a download button, reused while the frame is unchanged"""
+    return df.to_csv(index=False).encode("utf-8")
 
 
 def show_screening_page():
@@ -15,10 +72,6 @@ def show_screening_page():
     # ROUTE TO JOBS PAGE IF REQUESTED
     # ====================================================================
     if st.session_state.get("current_page") == "screening_jobs":
-        from frontend.streamlit_modules.pages.screening_jobs_ui import (
-            show_screening_jobs_page,
-        )
-
         show_screening_jobs_page()
         return
     # ====================================================================
@@ -32,21 +85,22 @@ def show_screening_page():
     )
 
     st.title("🔍 Live Market Screening")
+    show_queued_toast()
     st.markdown("Screen the S&P 500 with your saved strategies")
 
     # ====================================================================
     # LOAD STRATEGIES
     # ====================================================================
     try:
-        from backend.storage.strategy_storage import StrategyStorage
-
-        storage = StrategyStorage()
+        storage = _get_storage()
 
         # Get actual logged-in user
         current_user = st.session_state.get("username", "default_user")
-        strategies = storage.get_strategies(user_id=current_user, include_shared=True)
+        strategy_options = _load_strategy_options(
+            current_user, os.path.getmtime(storage.db_path)
+        )
 
-        if not strategies:
+        if not strategy_options:
             st.warning(
                 "⚠️ **No strategies found!**\n\n"
                 "Go to Backtesting page to create and save a strategy first."
@@ -66,33 +120,42 @@ def show_screening_page():
     # ====================================================================
     st.subheader("📋 Select Strategy")
 
-    # Create strategy options
-    strategy_options = {}
-    for strategy in strategies:
-        # Add shared/private indicator
-        shared_icon = "🌍" if strategy.get("shared") else "📌"
-
-        # Add performance if available
-        perf = ""
-        if strategy.get("backtest_results"):
-            results = strategy["backtest_results"]
-            perf = f" - CAGR: {results.get('cagr', 0):.1f}%, Win: {results.get('win_rate', 0):.0f}%"
+    # Long lists: filter by name and cap the dropdown size
+    strategy_labels = list(strategy_options)
+    if len(strategy_labels) > _STRATEGY_FILTER_MIN:
+        search = st.text_input(
+            "Filter strategies",
+            key="screening_strategy_filter",
+            placeholder="Type part of a strategy name",
+        )
+        search = search.strip().lower()
+        if search:
+            matches = [label for label in strategy_labels if search in label.lower()]
+            if matches:
+                strategy_labels = matches
+            else:
+                st.caption("No strategy matches the filter, showing all")
 
-        label = f"{shared_icon} {strategy['name']}{perf}"
-        strategy_options[label] = strategy
+        if len(strategy_labels) > _STRATEGY_OPTIONS_MAX:
+            st.caption(
+                f"Showing {_STRATEGY_OPTIONS_MAX} of {len(strategy_labels)} "
+                "strategies, refine the filter to see more"
+            )
+            strategy_labels = strategy_labels[:_STRATEGY_OPTIONS_MAX]
 
     col1, col2 = st.columns([3, 1])
 
     with col1:
         selected_label = st.selectbox(
             "Strategy",
-            options=list(strategy_options.keys()),
+            options=strategy_labels,
             help="Select a saved strategy to use for screening",
         )
 
     with col2:
         st.markdown("<br>", unsafe_allow_html=True)  # Spacing
         if st.button("🔄 Refresh", help="Reload strategies", use_container_width=True):
+            _load_strategy_options.clear()
             st.rerun()
 
     selected_strategy = strategy_options[selected_label]
@@ -127,9 +190,7 @@ def show_screening_page():
         with col1:
             if st.button("✅ Yes, Delete", type="primary", use_container_width=True):
                 try:
-                    from backend.storage.strategy_storage import StrategyStorage
-
-                    storage = StrategyStorage()
+                    storage = _get_storage()
 
                     success = storage.delete_strategy(
                         strategy_id=strategy_to_delete["id"],
@@ -137,12 +198,11 @@ def show_screening_page():
                     )
 
                     if success:
-                        st.success(f"✅ Deleted '{strategy_to_delete['name']}'")
+                        queue_toast(f"Deleted '{strategy_to_delete['name']}'")
                         del st.session_state["confirm_delete_screening"]
                         if "screening_results" in st.session_state:
                             del st.session_state["screening_results"]
 
-                        time.sleep(1)
                         st.rerun()
                     else:
                         st.error("❌ Failed to delete strategy")
@@ -160,12 +220,7 @@ def show_screening_page():
         col1, col2 = st.columns(2)
 
         with col1:
-            st.markdown("**Parameters:**")
             params = selected_strategy["parameters"]
-            st.write(f"- MOS Threshold: {params.get('mos_threshold', 0)}%")
-            st.write(f"- Moat Threshold: {params.get('moat_threshold', 0)}/50")
-            st.write(f"- Sell MOS: {params.get('sell_mos_threshold', 0)}%")
-            st.write(f"- Sell Moat: {params.get('sell_moat_threshold', 0)}/50")
 
             methods = []
             if params.get("use_mos"):
@@ -174,7 +229,16 @@ def show_screening_page():
                 methods.append("PBT")
             if params.get("use_tencap"):
                 methods.append("TEN CAP")
-            st.write(f"- Methods: {', '.join(methods)}")
+
+            # One markdown block instead of a header plus one element per line
+            st.markdown(
+                "**Parameters:**\n"
+                f"- MOS Threshold: {params.get('mos_threshold', 0)}%\n"
+                f"- Moat Threshold: {params.get('moat_threshold', 0)}/50\n"
+                f"- Sell MOS: {params.get('sell_mos_threshold', 0)}%\n"
+                f"- Sell Moat: {params.get('sell_moat_threshold', 0)}/50\n"
+                f"- Methods: {', '.join(methods)}"
+            )
 
         with col2:
             if selected_strategy.get("description"):
@@ -182,12 +246,14 @@ def show_screening_page():
                 st.write(selected_strategy["description"])
 
             if selected_strategy.get("backtest_results"):
-                st.markdown("**Backtest Results:**")
                 results = selected_strategy["backtest_results"]
-                st.write(f"- Return: {results.get('return_pct', 0):.2f}%")
-                st.write(f"- CAGR: {results.get('cagr', 0):.2f}%")
-                st.write(f"- Sharpe: {results.get('sharpe_ratio', 0):.2f}")
-                st.write(f"- Win Rate: {results.get('win_rate', 0):.0f}%")
+                st.markdown(
+                    "**Backtest Results:**\n"
+                    f"- Return: {results.get('return_pct', 0):.2f}%\n"
+                    f"- CAGR: {results.get('cagr', 0):.2f}%\n"
+                    f"- Sharpe: {results.get('sharpe_ratio', 0):.2f}\n"
+                    f"- Win Rate: {results.get('win_rate', 0):.0f}%"
+                )
 
     st.divider()
 
@@ -196,14 +262,7 @@ def show_screening_page():
     # ====================================================================
     st.subheader("🌍 Select Stock Universe")
 
-    from backend.backtesting.universe.definitions import list_universes
-
-    universes = list_universes()
-
-    # Create options for selectbox
-    universe_options = {
-        f"{u['name']} ({u['count']} stocks)": u["key"] for u in universes
-    }
+    universe_options = _universe_options()
 
     selected_universe_label = st.selectbox(
         "Universe",
@@ -212,12 +271,8 @@ def show_screening_page():
         help="Choose which stocks to screen",
     )
 
-    selected_universe_key = universe_options[selected_universe_label]
-
-    # Show universe details
-    selected_universe_info = next(
-        u for u in universes if u["key"] == selected_universe_key
-    )
+    selected_universe_info = universe_options[selected_universe_label]
+    selected_universe_key = selected_universe_info["key"]
 
     st.caption(f"📊 {selected_universe_info['description']}")
 
@@ -288,8 +343,6 @@ def show_screening_page():
                 except Exception as e:
                     st.error(f"❌ Screening failed: {str(e)}")
                     with st.expander("🔍 Error Details"):
-                        import traceback
-
                         st.code(traceback.format_exc())
 
     # ====================================================================
@@ -300,9 +353,7 @@ def show_screening_page():
             "🚀 Submit Screening Job", type="primary", use_container_width=True
         ):
             try:
-                from backend.jobs.screening_queue import ScreeningJobQueue
-
-                queue = ScreeningJobQueue()
+                queue = get_queue()
 
                 # Submit job
                 job_id = queue.submit_job(
@@ -314,18 +365,18 @@ def show_screening_page():
                     parameters=selected_strategy["parameters"],
                 )
 
-                st.success(f"✅ Screening job submitted! Job ID: `{job_id[:8]}...`")
+                queue_toast(f"Screening job submitted! Job ID: `{job_id[:8]}...`")
+
+                # Show the new job right away instead of the cached list
+                fetch_user_jobs.clear()
 
                 # NAVIGATE TO JOBS PAGE
-                time.sleep(1.5)
                 st.session_state["current_page"] = "screening_jobs"
                 st.rerun()
 
             except Exception as e:
                 st.error(f"❌ Failed to submit job: {str(e)}")
                 with st.expander("🔍 Error Details"):
-                    import traceback
-
                     st.code(traceback.format_exc())
 
     # ====================================================================
@@ -346,9 +397,14 @@ def show_screening_page():
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
 
-        buy_stocks = results_df[results_df["Signal"] == "BUY"]
-        hold_stocks = results_df[results_df["Signal"] == "HOLD"]
-        sell_stocks = results_df[results_df["Signal"] == "SELL"]
+        # Sort once by MOS and split by signal in one pass; the partitions
+        # keep the sorted order
+        sorted_df = results_df.sort_values("MOS %", ascending=False)
+        signal_groups = dict(tuple(sorted_df.groupby("Signal", sort=False)))
+        empty = sorted_df.iloc[0:0]
+        buy_stocks = signal_groups.get("BUY", empty)
+        hold_stocks = signal_groups.get("HOLD", empty)
+        sell_stocks = signal_groups.get("SELL", empty)
 
         with col1:
             st.metric("🟢 BUY Signals", len(buy_stocks))
@@ -363,19 +419,25 @@ def show_screening_page():
             avg_mos = results_df["MOS %"].mean()
             st.metric("Avg MOS", f"{avg_mos:.1f}%")
 
-        # Tabs for signals
-        tab1, tab2, tab3, tab4 = st.tabs(["🟢 BUY", "🟡 HOLD", "🔴 SELL", "📊 All"])
+        # Signal view; unlike st.tabs only the selected view is rendered
+        view = st.radio(
+            "Signals",
+            options=["🟢 BUY", "🟡 HOLD", "🔴 SELL", "📊 All"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="screening_active_tab",
+        )
 
-        with tab1:
+        if view == "🟢 BUY":
             if len(buy_stocks) > 0:
                 st.dataframe(
-                    buy_stocks.sort_values("MOS %", ascending=False),
+                    buy_stocks,
                     use_container_width=True,
                     hide_index=True,
                 )
 
                 # Download
-                csv = buy_stocks.to_csv(index=False)
+                csv = _to_csv(buy_stocks)
                 st.download_button(
                     "📥 Download BUY signals (CSV)",
                     data=csv,
@@ -385,26 +447,30 @@ def show_screening_page():
             else:
                 st.info("No BUY signals found")
 
-        with tab2:
+        elif view == "🟡 HOLD":
             if len(hold_stocks) > 0:
                 st.dataframe(
-                    hold_stocks.sort_values("MOS %", ascending=False),
+                    hold_stocks,
                     use_container_width=True,
                     hide_index=True,
                 )
             else:
                 st.info("No HOLD signals")
 
-        with tab3:
+        elif view == "🔴 SELL":
             if len(sell_stocks) > 0:
                 st.dataframe(
-                    sell_stocks.sort_values("MOS %", ascending=True),
+                    # Lowest MOS first; stable sort from the original row
+                    # order, so equal scores keep the order they came in
+                    sell_stocks.sort_index(kind="mergesort").sort_values(
+                        "MOS %", ascending=True, kind="mergesort"
+                    ),
                     use_container_width=True,
                     hide_index=True,
                 )
 
                 # Download
-                csv = sell_stocks.to_csv(index=False)
+                csv = _to_csv(sell_stocks)
                 st.download_button(
                     "📥 Download SELL signals (CSV)",
                     data=csv,
@@ -414,15 +480,15 @@ def show_screening_page():
             else:
                 st.info("No SELL signals")
 
-        with tab4:
+        else:
             st.dataframe(
-                results_df.sort_values("MOS %", ascending=False),
+                sorted_df,
                 use_container_width=True,
                 hide_index=True,
             )
 
             # Download all
-            csv = results_df.to_csv(index=False)
+            csv = _to_csv(results_df)
             st.download_button(
                 "📥 Download All Results (CSV)",
                 data=csv,
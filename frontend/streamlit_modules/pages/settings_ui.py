@@ -1,9 +1,36 @@
+import functools
 import streamlit as st
 from ..config import get_text, change_language
 import backend.utils.config_load as config_load
 from backend.utils.user_preferences import save_user_persistence
 
 
+@functools.lru_cache(maxsize=8)
+def _language_options(language_codes):
+    """Anzeigename -> Sprachcode, Anzeigenamen und Rückrichtung
+
+    Die Rückrichtung liefert je Sprachcode (Anzeigename, Index in der Auswahl).
+    """
+    # Create language options from available languages
+    language_options = {}
+    for lang_code in language_codes:
+        if lang_code == "en":
+            language_options["English"] = lang_code
+        elif lang_code == "de":
+            language_options["Deutsch"] = lang_code
+        else:
+            language_options[lang_code.upper()] = lang_code
+
+    if not language_options:
+        language_options = {"English": "en", "Deutsch": "de"}
+
+    code_to_display = {}
+    for index, (display_name, code) in enumerate(language_options.items()):
+        code_to_display.setdefault(code, (display_name, index))
+
+    return language_options, tuple(language_options), code_to_display
+
+
 def show_settings_page():
     """Settings Interface - Nur benutzerspezifische Einstellungen"""
     st.header(f"⚙️ {get_text('settings.title')}")
@@ -17,32 +44,19 @@ def show_settings_page():
     current_lang = st.session_state.get("current_language", "en")
     all_languages = st.session_state.get("all_languages", {})
 
-    # Create language options from available languages
-    language_options = {}
-    for lang_code, lang_data in all_languages.items():
-        if lang_code == "en":
-            language_options["English"] = lang_code
-        elif lang_code == "de":
-            language_options["Deutsch"] = lang_code
-        else:
-            language_options[lang_code.upper()] = lang_code
-
-    if not language_options:
-        language_options = {"English": "en", "Deutsch": "de"}
+    language_options, language_labels, code_to_display = _language_options(
+        tuple(all_languages)
+    )
 
-    # Find current language display name
-    current_display = "English"
-    for display_name, code in language_options.items():
-        if code == current_lang:
-            current_display = display_name
-            break
+    # Find current language display name and its position (fallback: English)
+    current_display, current_index = code_to_display.get(
+        current_lang, code_to_display.get("en", ("English", 0))
+    )
 
     selected_lang = st.selectbox(
         get_text("settings.select_language"),
-        options=list(language_options.keys()),
-        index=list(language_options.keys()).index(current_display)
-        if current_display in language_options
-        else 0,
+        options=language_labels,
+        index=current_index,
         key="language_selector",
     )
 
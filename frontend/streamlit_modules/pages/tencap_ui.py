@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-from ..config import get_text, save_persistence_data, capture_output
+from ..config import get_text, save_persistence_data, mark_persist_dirty, capture_output
 import backend.logic.tencap as tencap_logic
 
 
@@ -47,7 +47,7 @@ def show_tencap_analysis():
                 st.session_state.global_ticker = ticker
                 # Save global ticker to persistence
                 st.session_state.persist["global_ticker"] = ticker
-                save_persistence_data()
+                mark_persist_dirty()
 
     with col2:
         multi_year = st.checkbox(
@@ -4,6 +4,7 @@ from frontend.streamlit_modules.config import (
     load_app_config,
     get_text,
     initialize_global_ticker,
+    flush_persistence_data,
 )
 from frontend.streamlit_modules.pages import (
     cagr_ui,
@@ -80,6 +81,7 @@ def main():
         get_text("app.select_analysis_mode"),
         list(analysis_modes.keys()),
         key="analysis_mode",
+        on_change=flush_persistence_data,
     )
 
     st.sidebar.markdown(f"**{get_text('app.current_mode')}:** {selected_mode}")
@@ -188,6 +188,36 @@ class TestInvestmentRecommendation:
         )
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "current_price,expected_code",
+        [
+            (50.0, "strong_buy"),
+            (150.0, "buy"),
+            (205.0, "hold"),
+            (250.0, "sell"),
+            (0.0, "no_data"),
+        ],
+    )
+    def test_recommendation_codes(self, current_price, expected_code):
+        """Test für die kanonischen Empfehlungs-Codes"""
+        result = backend.logic.mos._get_recommendation_code(current_price, 200.0, 100.0)
+        assert result == expected_code
+
+
+class TestMOSCore:
+    """Tests für die reine MOS-Arithmetik"""
+
+    def test_core_matches_formula(self):
+        """Test der Kernberechnung gegen die ausgeschriebene Formel"""
+        eps_10y, future_value, fair_value, mos_price = backend.logic.mos._mos_core(
+            5.0, 0.10, 0.15, 0.50
+        )
+
+        assert eps_10y == pytest.approx(5.0 * 1.10**10)
+        assert future_value == pytest.approx(eps_10y * 20)
+        assert fair_value == pytest.approx(future_value / 1.15**10)
+        assert mos_price == pytest.approx(fair_value * 0.5)
+
 
 class TestEdgeCases:
     """Tests für Grenzfälle und Randwerte"""
@@ -201,6 +201,79 @@ class TestPBTFromTicker:
         assert price_info["Price Comparison"] == "N/A"
         assert price_info["Investment Recommendation"] == "No price data available"
 
+    @patch("backend.api.fmp_api.get_key_metrics")
+    @patch("backend.api.fmp_api.get_current_price")
+    def test_calculate_pbt_with_prefetched_key_metrics(
+        self,
+        mock_current_price,
+        mock_key_metrics,
+        sample_key_metrics,
+        sample_current_price,
+    ):
+        """Test: übergebene Key Metrics ersetzen den API-Abruf"""
+        # Arrange
+        mock_current_price.return_value = sample_current_price
+
+        # Act
+        result = backend.logic.pbt.calculate_pbt_with_comparison(
+            "AAPL", 2023, 0.15, key_metrics=sample_key_metrics
+        )
+
+        # Assert
+        mock_key_metrics.assert_not_called()
+        assert result["fcf_per_share"] == 4.0
+        assert result["buy_price"] > 0
+
+    @patch("backend.api.fmp_api.get_key_metrics")
+    @patch("backend.api.fmp_api.get_current_price")
+    def test_calculate_pbt_multi_year_fetches_once(
+        self,
+        mock_current_price,
+        mock_key_metrics,
+        sample_key_metrics,
+        sample_current_price,
+    ):
+        """Test: Mehrjahres-Berechnung lädt Key Metrics nur einmal"""
+        # Arrange
+        mock_key_metrics.return_value = sample_key_metrics
+        mock_current_price.return_value = sample_current_price
+
+        # Act
+        results = backend.logic.pbt.calculate_pbt_multi_year(
+            "AAPL", [2021, 2022, 2023, 2024], 0.15
+        )
+
+        # Assert
+        mock_key_metrics.assert_called_once()
+        assert list(results) == [2021, 2022, 2023, 2024]
+        assert results[2021] is None  # Kein FCF für 2021 vorhanden
+        assert results[2022]["fcf_per_share"] == 3.5
+        assert results[2024]["fcf_per_share"] == 5.0
+
+    @patch("backend.api.fmp_api.get_key_metrics")
+    @patch("backend.api.fmp_api.get_current_price")
+    def test_print_pbt_analysis_multi_single_buffer(
+        self,
+        mock_current_price,
+        mock_key_metrics,
+        sample_key_metrics,
+        sample_current_price,
+        capsys,
+    ):
+        """Test: Mehrjahres-Report mit Jahres-Trennzeilen und einem Abruf"""
+        # Arrange
+        mock_key_metrics.return_value = sample_key_metrics
+        mock_current_price.return_value = sample_current_price
+
+        # Act
+        backend.logic.pbt.print_pbt_analysis_multi("AAPL", [2022, 2023], 0.15)
+        output = capsys.readouterr().out
+
+        # Assert
+        mock_key_metrics.assert_called_once()
+        assert output.index("=== Year 2022 ===") < output.index("=== Year 2023 ===")
+        assert output.count("PBT Analyse für AAPL") == 2
+
 
 class TestInvestmentRecommendation:
     """Tests für Investitionsempfehlungen"""
@@ -224,6 +297,21 @@ class TestInvestmentRecommendation:
         )
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "current_price,expected_code",
+        [
+            (50.0, "strong_buy"),
+            (150.0, "buy"),
+            (205.0, "hold"),
+            (250.0, "sell"),
+            (None, "no_data"),
+        ],
+    )
+    def test_recommendation_codes(self, current_price, expected_code):
+        """Test für die kanonischen Empfehlungs-Codes"""
+        result = backend.logic.pbt._get_recommendation_code(current_price, 200.0, 100.0)
+        assert result == expected_code
+
 
 class TestEdgeCases:
     """Tests für Grenzfälle und Randwerte"""
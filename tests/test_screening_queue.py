@@ -0,0 +1,74 @@
+# tests/test_screening_queue.py
+import pytest
+from backend.jobs.screening_queue import ScreeningJobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Queue on a temporary database"""
+    return ScreeningJobQueue(db_path=str(tmp_path / "jobs.db"))
+
+
+def _submit(queue, name, user_id="test_user"):
+    return queue.submit_job(
+        user_id=user_id,
+        strategy_id="strategy-1",
+        strategy_name=name,
+        universe_key="test_3",
+        universe_name="Test Universe",
+        parameters={"mos_threshold": 10.0},
+    )
+
+
+class TestGetUserJobs:
+    def test_newest_first(self, queue):
+        for i in range(3):
+            _submit(queue, f"S{i}")
+
+        names = [job["strategy_name"] for job in queue.get_user_jobs("test_user")]
+        assert names == ["S2", "S1", "S0"]
+
+    def test_limit(self, queue):
+        for i in range(5):
+            _submit(queue, f"S{i}")
+
+        jobs = queue.get_user_jobs("test_user", limit=2)
+        assert [j["strategy_name"] for j in jobs] == ["S4", "S3"]
+
+    def test_status_filter(self, queue):
+        job_ids = [_submit(queue, f"S{i}") for i in range(3)]
+        queue.cancel_job(job_ids[0], "test_user")
+
+        pending = queue.get_user_jobs("test_user", status="pending")
+        assert [j["strategy_name"] for j in pending] == ["S2", "S1"]
+
+    def test_other_users_excluded(self, queue):
+        _submit(queue, "Mine")
+        _submit(queue, "Theirs", user_id="other_user")
+
+        jobs = queue.get_user_jobs("test_user")
+        assert [j["strategy_name"] for j in jobs] == ["Mine"]
+
+
+class TestJobResults:
+    def test_user_jobs_exclude_results(self, queue):
+        job_id = _submit(queue, "Done")
+        queue.save_job_results(job_id, '[{"Ticker": "AAA"}]', {"total_stocks": 1})
+
+        job = queue.get_user_jobs("test_user")[0]
+        assert "results" not in job
+        assert job["status"] == "completed"
+        assert job["result_summary"] == {"total_stocks": 1}
+        assert job["parameters"] == {"mos_threshold": 10.0}
+
+    def test_get_job_results(self, queue):
+        job_id = _submit(queue, "Done")
+        queue.save_job_results(job_id, '[{"Ticker": "AAA"}]', {"total_stocks": 1})
+
+        assert queue.get_job_results(job_id) == [{"Ticker": "AAA"}]
+
+    def test_get_job_results_missing(self, queue):
+        job_id = _submit(queue, "Pending")
+
+        assert queue.get_job_results(job_id) is None
+        assert queue.get_job_results("unknown") is None